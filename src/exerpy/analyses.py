@@ -265,7 +265,8 @@ class ExergyAnalysis:
         return cls(data['components'], data['connections'], Tamb, pamb, chemExLib, split_physical_exergy)
 
     @classmethod
-    def from_aspen(cls, path, Tamb=None, pamb=None, chemExLib=None, split_physical_exergy=True):
+    def from_aspen(cls, path, Tamb=None, pamb=None, chemExLib=None, split_physical_exergy=True, cache_dir=None,
+                   force=False):
         """
         Create an instance of the ExergyAnalysis class from an Aspen model file.
 
@@ -281,6 +282,12 @@ class ExergyAnalysis:
             Name of the chemical exergy library (if any).
         split_physical_exergy : bool, optional
             If True, separates physical exergy into thermal and mechanical components.
+        cache_dir : str, optional
+            Directory to cache the parsed model data in. An unchanged model file is
+            then loaded from the cache instead of being parsed by Aspen Plus again.
+        force : bool, optional
+            If True, the model is parsed again even if a cached result exists, and the
+            cache entry is refreshed.
 
         Returns
         -------
@@ -295,7 +302,9 @@ class ExergyAnalysis:
 
         if file_extension == '.bkp':
             logging.info("Running Ebsilon simulation and generating JSON data.")
-            data = aspen_parser.run_aspen(path, split_physical_exergy=split_physical_exergy)
+            data = aspen_parser.run_aspen(
+                path, split_physical_exergy=split_physical_exergy, cache_dir=cache_dir, force=force
+            )
             logging.info("Simulation completed successfully.")
 
         else:
@@ -312,7 +321,8 @@ class ExergyAnalysis:
         return cls(data["components"], data["connections"], Tamb, pamb, chemExLib, split_physical_exergy)
 
     @classmethod
-    def from_ebsilon(cls, path, Tamb=None, pamb=None, chemExLib=None, split_physical_exergy=True):
+    def from_ebsilon(cls, path, Tamb=None, pamb=None, chemExLib=None, split_physical_exergy=True, cache_dir=None,
+                     force=False):
         """
         Create an instance of the ExergyAnalysis class from an Ebsilon model file.
 
@@ -328,6 +338,12 @@ class ExergyAnalysis:
             Name of the chemical exergy library (if any).
         split_physical_exergy : bool, optional
             If True, separates physical exergy into thermal and mechanical components.
+        cache_dir : str, optional
+            Directory to cache the parsed model data in. An unchanged model file is
+            then loaded from the cache instead of being simulated by Ebsilon again.
+        force : bool, optional
+            If True, the model is parsed again even if a cached result exists, and the
+            cache entry is refreshed.
 
         Returns
         -------
@@ -342,7 +358,9 @@ class ExergyAnalysis:
 
         if file_extension == '.ebs':
             logging.info("Running Ebsilon simulation and generating JSON data.")
-            data = ebs_parser.run_ebsilon(path, split_physical_exergy=split_physical_exergy)
+            data = ebs_parser.run_ebsilon(
+                path, split_physical_exergy=split_physical_exergy, cache_dir=cache_dir, force=force
+            )
             logging.info("Simulation completed successfully.")
 
         else:
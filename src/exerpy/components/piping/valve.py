@@ -261,7 +261,7 @@ class Valve(Component):
         return A, b, counter, equations
             
     def dis_eqs(self, A, b, counter, T0, equations, chemical_exergy_enabled=False, all_components=None):
-        """
+        r"""
         Constructs the cost equations for a dissipative Valve in ExerPy,
         distributing the valve’s extra cost difference (C_diff) to all other productive 
         components (non-dissipative and non-CycleCloser) in proportion to their exergy destruction (E_D)
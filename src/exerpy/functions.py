@@ -1,12 +1,15 @@
+import hashlib
 import json
 import logging
 import math
 import os
 import sys
+import tempfile
 
 import CoolProp.CoolProp as CP
 
 from exerpy import __datapath__
+from exerpy import __version__
 
 
 def mass_to_molar_fractions(mass_fractions):
@@ -302,7 +305,7 @@ def add_chemical_exergy(my_json, Tamb, pamb, chemExLib):
 
 
 def add_total_exergy_flow(my_json, split_physical_exergy):
-    """
+    r"""
     Adds the total exergy flow to each connection in the JSON data based on its kind.
 
     - For 'material' connections, the exergy is calculated as before.
@@ -491,6 +494,90 @@ def convert_to_SI(property, value, unit):
         raise ValueError(f"An error occurred during the unit conversion: {e}")
 
 
+# Bump whenever the parsers change their output, so that cached parse results
+# written by an older parser are no longer used.
+_CACHE_SCHEMA = 1
+
+
+def model_cache_path(model_path, split_physical_exergy, cache_dir):
+    """
+    Get the cache file of a simulation model, keyed by the content of the model file.
+
+    The key also includes the exerpy version and the cache schema, so a changed
+    parser never returns results cached by an older one.
+
+    Parameters
+    ----------
+    model_path : str
+        Path to the model file.
+    split_physical_exergy : bool
+        Split physical exergy in mechanical and thermal shares.
+    cache_dir : str
+        Directory holding the cached parse results.
+
+    Returns
+    -------
+    str
+        Path of the cache file.
+    """
+    file_hash = hashlib.sha256()
+    with open(model_path, 'rb') as model_file:
+        for chunk in iter(lambda: model_file.read(1 << 20), b''):
+            file_hash.update(chunk)
+    file_hash.update(b'split' if split_physical_exergy else b'nosplit')
+    file_hash.update(f"exerpy-{__version__}-schema-{_CACHE_SCHEMA}".encode())
+    return os.path.join(cache_dir, f"{file_hash.hexdigest()}.json")
+
+
+def read_model_cache(cache_path):
+    """
+    Read parsed model data from a cache file.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the cache file.
+
+    Returns
+    -------
+    dict or None
+        The cached data, or None if there is no readable cache entry.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    logging.info(f"Loading cached parse result from {cache_path}")
+    try:
+        with open(cache_path) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not read parse cache {cache_path}, parsing the model again: {e}")
+        return None
+
+
+def write_model_cache(cache_path, data):
+    """
+    Atomically write parsed model data to a cache file.
+
+    An interrupted run never leaves a partial cache entry.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the cache file.
+    data : dict
+        Parsed data to be cached.
+    """
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
 
 fluid_property_data = {
     'm': {
@@ -29,6 +29,20 @@ This is the mapping of component groups to their respective component IDs:
 
 """
 
+# Component group of each Aspen block type. 'Compr' blocks are listed under both "Turbine" and
+# "Compressor"; iterating the groups in reverse keeps "Turbine" for blocks without a MODEL_TYPE override.
+component_groups = {
+    block_type: group_name
+    for group_name, type_list in reversed(grouped_components.items())
+    for block_type in type_list
+}
+
+# Component types set from the MODEL_TYPE input of a block (e.g. Compr blocks)
+model_type_overrides = {
+    "COMPRESSOR": "Compressor",
+    "TURBINE": "Turbine",
+}
+
 connector_mappings = {
     'Turbine': {
         'F(IN)': 0,    # inlet gas flow
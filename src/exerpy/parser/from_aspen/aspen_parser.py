@@ -4,9 +4,26 @@ import os
 
 from exerpy.functions import convert_to_SI
 from exerpy.functions import fluid_property_data
+from exerpy.functions import model_cache_path
+from exerpy.functions import read_model_cache
+from exerpy.functions import write_model_cache
 
+from .aspen_config import component_groups
 from .aspen_config import connector_mappings
-from .aspen_config import grouped_components
+from .aspen_config import model_type_overrides
+
+# Properties of material streams: key in the connection data, physical quantity for the unit
+# conversion, path of the result node below the stream node, and whether to take the absolute value
+_MATERIAL_STREAM_PROPERTIES = (
+    ('T', 'T', r'\Output\TEMP_OUT\MIXED', False),
+    ('p', 'p', r'\Output\PRES_OUT\MIXED', False),
+    ('h', 'h', r'\Output\HMX_MASS\MIXED', False),
+    ('s', 's', r'\Output\SMX_MASS\MIXED', False),
+    ('m', 'm', r'\Output\MASSFLMX\MIXED', False),
+    ('energy_flow', 'power', r'\Output\HMX_FLOW\MIXED', True),
+    ('e_PH', 'e', r'\Output\STRM_UPP\EXERGYMS\MIXED\TOTAL', False),
+    ('n', 'n', r'\Output\TOT_FLOW', False),
+)
 
 
 class AspenModelParser:
@@ -41,9 +58,15 @@ class AspenModelParser:
         Initializes the Aspen Plus application and opens the specified model.
         """
         from win32com.client import Dispatch
+        from win32com.client import gencache
         try:
-            # Start Aspen Plus application via COM Dispatch
-            self.aspen = Dispatch('Apwn.Document')
+            # Start Aspen Plus application via early-bound COM Dispatch, so that attribute and
+            # method calls use the wrappers generated from the type library instead of IDispatch lookups
+            try:
+                self.aspen = gencache.EnsureDispatch('Apwn.Document')
+            except Exception as e:
+                logging.warning(f"Early-bound COM dispatch not available ({e}), falling back to late binding.")
+                self.aspen = Dispatch('Apwn.Document')
             # Load the Aspen model file
             self.aspen.InitFromArchive2(self.model_path)
             logging.info(f"Model opened successfully: {self.model_path}")
@@ -74,161 +97,125 @@ class AspenModelParser:
         """
         Parses the streams (connections) in the Aspen model.
         """
-        # Get the stream nodes and their names
-        stream_nodes = self.aspen.Tree.FindNode(r'\Data\Streams').Elements
-        stream_names = [stream_node.Name for stream_node in stream_nodes]
-
         # ALL ASPEN CONNECTIONS
+        # The streams are parsed one after another: Aspen is an apartment-threaded COM server,
+        # so calls from worker threads would be marshalled back and serialized anyway
+        for stream_node in self.aspen.Tree.FindNode(r'\Data\Streams').Elements:
+            stream_name = stream_node.Name
+            self.connections_data[stream_name] = self._parse_stream(stream_name)
+
+
+    def _parse_stream(self, stream_name):
+        """
+        Parses a single stream (connection) of the Aspen model.
+
+        Parameters
+        ----------
+        stream_name : str
+            Name of the stream in the Aspen model.
+
+        Returns
+        -------
+        dict
+            Connection data of the stream.
+        """
+        # Bind the tree once: every access of .Tree on the COM document is a call into Aspen
+        tree = self.aspen.Tree
+        stream_path = fr'\Data\Streams\{stream_name}'
+
         # Initialize connection data with the common fields
-        for stream_name in stream_names:
-            stream_node = self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}')
-            connection_data = {
-                'name': stream_name,
-                'kind': None,
-                'source_component': None,
-                'source_connector': None,
-                'target_component': None,
-                'target_connector': None,
-            }
+        connection_data = {
+            'name': stream_name,
+            'kind': None,
+            'source_component': None,
+            'source_connector': None,
+            'target_component': None,
+            'target_connector': None,
+        }
 
-            # Find the source and target components
-            source_port_node = self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Ports\SOURCE')
-            if source_port_node is not None and source_port_node.Elements.Count > 0:
-                connection_data["source_component"] = source_port_node.Elements(0).Name
-
-            destination_port_node = self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Ports\DEST')
-            if destination_port_node is not None and destination_port_node.Elements.Count > 0:
-                connection_data["target_component"] = destination_port_node.Elements(0).Name
-
-            # HEAT AND POWER STREAMS
-            if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Input\WORK') is not None:
-                connection_data['kind'] = 'power'
-                connection_data['energy_flow'] = convert_to_SI(
-                    'power',
-                    abs(self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\POWER_OUT').Value),
-                    self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\POWER_OUT').UnitString
-                    ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\POWER_OUT') is not None else None
-            elif self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Input\HEAT') is not None:
-                connection_data['kind'] = 'heat'
-                connection_data['energy_flow'] = convert_to_SI(
-                    'power',
-                    abs(self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\QCALC').Value),
-                    self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\QCALC').UnitString
-                    ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\QCALC') is not None else None
-
-            # MATERIAL STREAMS
-            else:
-                # Assume it's a material stream and retrieve additional properties
-                connection_data.update({
-                    'kind': 'material',
-                    'T': (
-                        convert_to_SI(
-                            'T',
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\TEMP_OUT\MIXED').Value,
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\TEMP_OUT\MIXED').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\TEMP_OUT\MIXED') is not None else None
-                    ),
-                    'T_unit': fluid_property_data['T']['SI_unit'],
-                    'p': (
-                        convert_to_SI(
-                            'p',
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\PRES_OUT\MIXED').Value,
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\PRES_OUT\MIXED').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\PRES_OUT\MIXED') is not None else None
-                    ),
-                    'p_unit': fluid_property_data['p']['SI_unit'],
-                    'h': (
-                        convert_to_SI(
-                            'h',
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\HMX_MASS\MIXED').Value,
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\HMX_MASS\MIXED').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\HMX_MASS\MIXED') is not None else None
-                    ),
-                    'h_unit': fluid_property_data['h']['SI_unit'],
-                    's': (
-                        convert_to_SI(
-                            's',
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\SMX_MASS\MIXED').Value,
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\SMX_MASS\MIXED').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\SMX_MASS\MIXED') is not None else None
-                    ),
-                    's_unit': fluid_property_data['s']['SI_unit'],
-                    'm': (
-                        convert_to_SI(
-                            'm',
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\MASSFLMX\MIXED').Value,
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\MASSFLMX\MIXED').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\MASSFLMX\MIXED') is not None else None
-                    ),
-                    'm_unit': fluid_property_data['m']['SI_unit'],
-                    'energy_flow': (
-                        convert_to_SI(
-                            'power',
-                            abs(self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\HMX_FLOW\MIXED').Value),
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\HMX_FLOW\MIXED').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\HMX_FLOW\MIXED') is not None else None
-                    ),
-                    'energy_flow_unit': fluid_property_data['power']['SI_unit'],
-                    'e_PH': (
-                        convert_to_SI(
-                            'e',
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\STRM_UPP\EXERGYMS\MIXED\TOTAL').Value,
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\STRM_UPP\EXERGYMS\MIXED\TOTAL').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\STRM_UPP\EXERGYMS\MIXED\TOTAL') is not None else (
-                            logging.warning(f"e_PH node not found for stream {stream_name}"),
-                            None
-                        )[1]
-                    ),
-                    'e_PH_unit': fluid_property_data['e']['SI_unit'],
-                    'n': (
-                        convert_to_SI(
-                            'n',
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\TOT_FLOW').Value,
-                            self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\TOT_FLOW').UnitString
-                        ) if self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\TOT_FLOW') is not None else None
-                    ),
-                    'n_unit': fluid_property_data['n']['SI_unit'],
-                    'mass_composition': {},
-                    'molar_composition': {},
-                })
-                # Retrieve the fluid names for the stream
-                mole_frac_node = self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED')
-                if mole_frac_node is not None:
-                    fluid_names = [fluid.Name for fluid in mole_frac_node.Elements]
-
-                    # Retrieve the molar composition for each fluid
-                    for fluid_name in fluid_names:
-                        mole_frac = self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED\{fluid_name}').Value
-                        if mole_frac not in [0, None]:  # Skip fluids with 0 or None as the fraction
-                            connection_data["molar_composition"][fluid_name] = mole_frac
-
-                mass_frac_node = self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\MASSFRAC\MIXED')
-                if mass_frac_node is not None:
-                    # Retrieve the mass composition for each fluid
-                    for fluid_name in [fluid.Name for fluid in mass_frac_node.Elements]:
-                        mass_frac = self.aspen.Tree.FindNode(fr'\Data\Streams\{stream_name}\Output\MASSFRAC\MIXED\{fluid_name}').Value
-                        if mass_frac not in [0, None]:  # Skip fluids with 0 or None as the fraction
-                            connection_data["mass_composition"][fluid_name] = mass_frac
-
-            # Store connection data
-            self.connections_data[stream_name] = connection_data
+        # Find the source and target components
+        source_port_node = tree.FindNode(stream_path + r'\Ports\SOURCE')
+        if source_port_node is not None and source_port_node.Elements.Count > 0:
+            connection_data["source_component"] = source_port_node.Elements(0).Name
+
+        destination_port_node = tree.FindNode(stream_path + r'\Ports\DEST')
+        if destination_port_node is not None and destination_port_node.Elements.Count > 0:
+            connection_data["target_component"] = destination_port_node.Elements(0).Name
+
+        # HEAT AND POWER STREAMS
+        if tree.FindNode(stream_path + r'\Input\WORK') is not None:
+            connection_data['kind'] = 'power'
+            connection_data['energy_flow'] = self._energy_flow(tree.FindNode(stream_path + r'\Output\POWER_OUT'))
+        elif tree.FindNode(stream_path + r'\Input\HEAT') is not None:
+            connection_data['kind'] = 'heat'
+            connection_data['energy_flow'] = self._energy_flow(tree.FindNode(stream_path + r'\Output\QCALC'))
+
+        # MATERIAL STREAMS
+        else:
+            # Assume it's a material stream and retrieve additional properties
+            connection_data['kind'] = 'material'
+            for key, quantity, path, absolute in _MATERIAL_STREAM_PROPERTIES:
+                node = tree.FindNode(stream_path + path)
+                if node is not None:
+                    value = abs(node.Value) if absolute else node.Value
+                    connection_data[key] = convert_to_SI(quantity, value, node.UnitString)
+                else:
+                    if key == 'e_PH':
+                        logging.warning(f"e_PH node not found for stream {stream_name}")
+                    connection_data[key] = None
+                connection_data[f'{key}_unit'] = fluid_property_data[quantity]['SI_unit']
+            connection_data['mass_composition'] = {}
+            connection_data['molar_composition'] = {}
+
+            # Enumerate the fluid nodes of the composition once per stream and read their
+            # values directly instead of resolving every fluid path from the tree root
+            mole_frac_node = tree.FindNode(stream_path + r'\Output\MOLEFRAC\MIXED')
+            if mole_frac_node is not None:
+                for fluid in mole_frac_node.Elements:
+                    mole_frac = fluid.Value
+                    if mole_frac:  # Skip fluids with 0 or None as the fraction
+                        connection_data["molar_composition"][fluid.Name] = mole_frac
+
+            mass_frac_node = tree.FindNode(stream_path + r'\Output\MASSFRAC\MIXED')
+            if mass_frac_node is not None:
+                for fluid in mass_frac_node.Elements:
+                    mass_frac = fluid.Value
+                    if mass_frac:  # Skip fluids with 0 or None as the fraction
+                        connection_data["mass_composition"][fluid.Name] = mass_frac
+
+        return connection_data
+
+
+    @staticmethod
+    def _energy_flow(node):
+        """
+        Converts the value of a power or heat result node to an absolute energy flow in SI units.
+
+        Parameters:
+            node: Result node of the Aspen tree, or None if the node does not exist.
+
+        Returns:
+            float or None: Absolute energy flow in W, None if the node does not exist.
+        """
+        return convert_to_SI('power', abs(node.Value), node.UnitString) if node is not None else None
 
 
     def parse_blocks(self):
         """
         Parses the blocks (components) in the Aspen model and ensures that all components, including motors created from pumps, are properly grouped.
         """
-        block_nodes = self.aspen.Tree.FindNode(r'\Data\Blocks').Elements
-        block_names = [block_node.Name for block_node in block_nodes]
-
-        # Process each block
-        for block_name in block_names:
-            model_type_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Input\MODEL_TYPE')
+        tree = self.aspen.Tree
+        # SI units of the energy flows are the same for all blocks
+        power_unit = fluid_property_data['power']['SI_unit']
+        heat_unit = fluid_property_data['heat']['SI_unit']
+
+        # Process each block, using the element of the Blocks collection as the block node
+        for component_type_node in tree.FindNode(r'\Data\Blocks').Elements:
+            block_name = component_type_node.Name
+            block_path = fr'\Data\Blocks\{block_name}'
+            model_type_node = tree.FindNode(block_path + r'\Input\MODEL_TYPE')
             model_type = model_type_node.Value if model_type_node is not None else None
 
-            component_type_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}')
-            if component_type_node is None:
-                continue
             component_type = component_type_node.AttributeValue(6)
             if component_type == "Mixer":
                 mixer_value = component_type_node.Value
@@ -236,110 +223,64 @@ class AspenModelParser:
                     logging.info(f"Ignoring Mixer {block_name} with value {mixer_value}.")
                     continue
 
+            # Look up each output node once and reuse it for the None-check, value and unit
+            eff_isen_node = tree.FindNode(block_path + r'\Output\EFF_ISEN')
+            eff_mech_node = tree.FindNode(block_path + r'\Output\EFF_MECH')
+            qnet_node = tree.FindNode(block_path + r'\Output\QNET')
+            brake_power_node = tree.FindNode(block_path + r'\Output\BRAKE_POWER')
+
             component_data = {
                 'name': block_name,
                 'type': component_type,
-                'eta_s': (
-                    self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\EFF_ISEN').Value
-                    if self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\EFF_ISEN') is not None else None
-                ),
-                'eta_mech': (
-                    self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\EFF_MECH').Value
-                    if self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\EFF_MECH') is not None else None
-                ),
+                'eta_s': eff_isen_node.Value if eff_isen_node is not None else None,
+                'eta_mech': eff_mech_node.Value if eff_mech_node is not None else None,
                 'Q': (
-                    convert_to_SI(
-                        'heat',
-                        self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\QNET').Value,
-                        self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\QNET').UnitString,
-                    ) if self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\QNET') is not None else None
+                    convert_to_SI('heat', qnet_node.Value, qnet_node.UnitString)
+                    if qnet_node is not None else None
                 ),
-                'Q_unit': fluid_property_data['heat']['SI_unit'],
+                'Q_unit': heat_unit,
                 'P': (
-                    convert_to_SI(
-                        'power',
-                        abs(self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\BRAKE_POWER').Value),
-                        self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\BRAKE_POWER').UnitString,
-                    ) if self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\BRAKE_POWER') is not None else None
+                    convert_to_SI('power', abs(brake_power_node.Value), brake_power_node.UnitString)
+                    if brake_power_node is not None else None
                 ),
-                'P_unit': fluid_property_data['power']['SI_unit'],
+                'P_unit': power_unit,
             }
 
             # Override component type based on model_type
-            if model_type is not None:
-                if model_type == "COMPRESSOR":
-                    component_data['type'] = "Compressor"
-                elif model_type == "TURBINE":
-                    component_data['type'] = "Turbine"
+            if model_type in model_type_overrides:
+                component_data['type'] = model_type_overrides[model_type]
 
 
             # Handle Generators & Motors (if not in a Pump) as multiplier blocks
             if component_type == 'Mult':
-                mult_value_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}')
-                mult_value = mult_value_node.Value if mult_value_node is not None else None
+                mult_value = component_type_node.Value
                 if mult_value == 'WORK':
-                    factor_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Input\FACTOR')
+                    factor_node = tree.FindNode(block_path + r'\Input\FACTOR')
                     factor = factor_node.Value if factor_node is not None else None
                     if factor is not None:
-                        if factor < 1:
-                            component_data.update({
-                                'eta_el': factor,
-                                'type': 'Generator'
-                            })
-                        elif factor > 1:
-                            elec_power_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\WS(OUT)').Elements(0)
-                            elec_power_name = elec_power_node.Name
-                            if elec_power_name in self.connections_data:
-                                elec_power = abs(self.connections_data[elec_power_name]['energy_flow'])
-                            else:
-                                logging.warning(f"No WS(IN) ports found for block {block_name}")
-                                elec_power = None
-                            brake_power_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\WS(IN)').Elements(0)
-                            brake_power_name = brake_power_node.Name
-                            if brake_power_name in self.connections_data:
-                                brake_power = abs(self.connections_data[brake_power_name]['energy_flow'])
-                            else:
-                                logging.warning(f"No WS(IN) ports found for block {block_name}")
-                                brake_power = None
+                        # Decide once whether the multiplier is a Motor or a Generator
+                        if factor == 1:
+                            choice = input(f"Multiplier Block '{block_name}' has factor = 1. Enter 'G' if it is a Generator or 'M' for Motor: ").strip().upper()
+                            is_motor = choice == 'M'
+                        else:
+                            is_motor = factor > 1
+
+                        if is_motor:
                             component_data.update({
                                 'eta_el': 1/factor,
-                                'multiplier factor' : factor,
                                 'type': 'Motor',
-                                'P_el': elec_power,
-                                'P_el_unit': fluid_property_data['power']['SI_unit'],
-                                'P_mech': brake_power,
-                                'P_mech_unit': fluid_property_data['power']['SI_unit'],
+                                'P_el': self._port_energy_flow(block_name, 'WS(OUT)'),
+                                'P_el_unit': power_unit,
+                                'P_mech': self._port_energy_flow(block_name, 'WS(IN)'),
+                                'P_mech_unit': power_unit,
+                            })
+                            if factor > 1:
+                                component_data['multiplier factor'] = factor
+                        else:
+                            component_data.update({
+                                'eta_el': factor,
+                                'type': 'Generator'
                             })
-                        else:  # factor == 1
-                            choice = input(f"Multiplier Block '{block_name}' has factor = 1. Enter 'G' if it is a Generator or 'M' for Motor: ").strip().upper()
-                            if choice == 'M':
-                                elec_power_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\WS(OUT)').Elements(0)
-                                elec_power_name = elec_power_node.Name
-                                if elec_power_name in self.connections_data:
-                                    elec_power = abs(self.connections_data[elec_power_name]['energy_flow'])
-                                else:
-                                    logging.warning(f"No WS(IN) ports found for block {block_name}")
-                                    elec_power = None
-                                brake_power_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\WS(IN)').Elements(0)
-                                brake_power_name = brake_power_node.Name
-                                if brake_power_name in self.connections_data:
-                                    brake_power = abs(self.connections_data[brake_power_name]['energy_flow'])
-                                else:
-                                    logging.warning(f"No WS(IN) ports found for block {block_name}")
-                                    brake_power = None
-                                component_data.update({
-                                    'eta_el': factor,
-                                    'type': 'Motor',
-                                    'P_el': elec_power,
-                                    'P_el_unit': fluid_property_data['power']['SI_unit'],
-                                    'P_mech': brake_power,
-                                    'P_mech_unit': fluid_property_data['power']['SI_unit'],
-                                })
-                            else:
-                                component_data.update({
-                                    'eta_el': factor,
-                                    'type': 'Generator'
-                                })
 
             # Create a connection for the heat flows of the SimpleHeatExchanger blocks
             if component_type == 'Heater':
@@ -352,7 +293,7 @@ class AspenModelParser:
                     'target_component': None,  # Heat assumed to leave the system (not relevant for exergy analysis)
                     'target_connector': None,  # Heat assumed to leave the system (not relevant for exergy analysis)
                     'energy_flow': abs(component_data['Q']),  # the user defines in the balances if the heat flow is positive or negative
-                    'energy_flow_unit': fluid_property_data['heat']['SI_unit'],
+                    'energy_flow_unit': heat_unit,
                 }
 
                 # Store the heat connection
@@ -364,20 +305,20 @@ class AspenModelParser:
             # Handle Pumps and their associated Motors
             if component_type == 'Pump':
                 motor_name = f"{block_name}-MOTOR"
-                elec_power_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\ELEC_POWER')
+                elec_power_node = tree.FindNode(block_path + r'\Output\ELEC_POWER')
                 elec_power = abs(convert_to_SI('power', elec_power_node.Value, elec_power_node.UnitString,)) if elec_power_node is not None else None
-                brake_power_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\BRAKE_POWER')
-                brake_power = abs(convert_to_SI('power', brake_power_node.Value, brake_power_node.UnitString,)) if brake_power_node is not None else None
-                eff_driv_node = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Output\EFF_DRIV')
+                # The brake power was already read for the pump itself
+                brake_power = component_data['P']
+                eff_driv_node = tree.FindNode(block_path + r'\Output\EFF_DRIV')
                 eff_driv = eff_driv_node.Value if eff_driv_node is not None else None
 
                 motor_data = {
                     'name': motor_name,
                     'type': 'Motor',
                     'P_el': elec_power,
-                    'P_el_unit': fluid_property_data['power']['SI_unit'],
+                    'P_el_unit': power_unit,
                     'P_mech': brake_power,
-                    'P_mech_unit': fluid_property_data['power']['SI_unit'],
+                    'P_mech_unit': power_unit,
                     'eta_el': (
                         eff_driv
                         if eff_driv is not None else None
@@ -398,7 +339,7 @@ class AspenModelParser:
                         'target_component': motor_name,
                         'target_connector': 0,
                         'energy_flow': motor_data['P_el'],
-                        'energy_flow_unit': fluid_property_data['power']['SI_unit'],
+                        'energy_flow_unit': power_unit,
                     }
 
                     mech_connection_name = f"{block_name}_MECH"
@@ -410,7 +351,7 @@ class AspenModelParser:
                         'target_component': block_name,
                         'target_connector': 1,
                         'energy_flow': motor_data['P_mech'],
-                        'energy_flow_unit': fluid_property_data['power']['SI_unit'],
+                        'energy_flow_unit': power_unit,
                     }
 
                     # Store the motor connection
@@ -421,6 +362,24 @@ class AspenModelParser:
             self.assign_connectors(component_data, block_name)
 
 
+    def _port_energy_flow(self, block_name, port_name):
+        """
+        Returns the absolute energy flow of the work stream connected to a port of a block.
+
+        Parameters:
+            block_name (str): Name of the block.
+            port_name (str): Name of the port, e.g. 'WS(IN)' or 'WS(OUT)'.
+
+        Returns:
+            float or None: Absolute energy flow of the connected stream, None if no parsed stream is connected.
+        """
+        stream_name = self.aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\{port_name}').Elements(0).Name
+        if stream_name in self.connections_data:
+            return abs(self.connections_data[stream_name]['energy_flow'])
+        logging.warning(f"No {port_name} ports found for block {block_name}")
+        return None
+
+
     def assign_connectors(self, component_data, block_name):
         """
         Assigns connectors to streams for each component based on its type.
@@ -448,10 +407,9 @@ class AspenModelParser:
         inlet_streams = []
         outlet_streams = []
 
-        for port in ports_node.Elements:
-            port_label = port.Name
-            port_node = aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\{port_label}')
-            if port_node is not None and port_node.Elements.Count > 0:
+        for port_node in ports_node.Elements:
+            port_label = port_node.Name
+            if port_node.Elements.Count > 0:
                 for element in port_node.Elements:
                     stream_name = element.Name
                     if stream_name in connections_data:
@@ -490,10 +448,9 @@ class AspenModelParser:
         outlet_streams = []
 
         # Iterate over all ports connected to the splitter
-        for port in ports_node.Elements:
-            port_label = port.Name
-            port_node = aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\{port_label}')
-            if port_node is not None and port_node.Elements.Count > 0:
+        for port_node in ports_node.Elements:
+            port_label = port_node.Name
+            if port_node.Elements.Count > 0:
                 for element in port_node.Elements:
                     stream_name = element.Name
                     if stream_name in connections_data:
@@ -527,13 +484,12 @@ class AspenModelParser:
             return
 
         # Iterate over all ports and assign connectors based on port labels
-        for port in ports_node.Elements:
-            port_label = port.Name
+        for port_node in ports_node.Elements:
+            port_label = port_node.Name
 
             # Handle inlet ports
             if '(IN)' in port_label:
-                port_node = aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\{port_label}')
-                if port_node is not None and port_node.Elements.Count > 0:
+                if port_node.Elements.Count > 0:
                     for element in port_node.Elements:
                         stream_name = element.Name
                         if stream_name in connections_data:
@@ -549,8 +505,7 @@ class AspenModelParser:
 
             # Handle outlet ports
             elif '(OUT)' in port_label:
-                port_node = aspen.Tree.FindNode(fr'\Data\Blocks\{block_name}\Ports\{port_label}')
-                if port_node is not None and port_node.Elements.Count > 0:
+                if port_node.Elements.Count > 0:
                     for element in port_node.Elements:
                         stream_name = element.Name
                         if stream_name in connections_data:
@@ -593,16 +548,9 @@ class AspenModelParser:
         - component_data: The dictionary of component attributes.
         - component_name: The name of the component.
         """
-        # Determine the group for the component based on its type
-        group = None
-        for group_name, type_list in grouped_components.items():
-            if component_data['type'] in type_list:
-                group = group_name
-                break
-
-        # If the component doesn't belong to any predefined group, use its type name
-        if not group:
-            group = component_data['type']
+        # Determine the group for the component based on its type. If the component doesn't
+        # belong to any predefined group, use its type name
+        group = component_groups.get(component_data['type'], component_data['type'])
 
         # Initialize the group in the components_data dictionary if not already present
         if group not in self.components_data:
@@ -664,25 +612,27 @@ class AspenModelParser:
         return {'components': sorted_components, 'connections': sorted_connections, 'ambient_conditions': ambient_conditions}
 
 
-    def write_to_json(self, output_path):
+    def write_to_json(self, output_path, data=None):
         """
         Writes the parsed and sorted data to a JSON file.
 
         Parameters:
             output_path (str): Path where the JSON file will be saved.
+            data (dict): Optional data to write, as returned by get_sorted_data. If None, it is built from the parsed model.
         """
-        data = self.get_sorted_data()
+        if data is None:
+            data = self.get_sorted_data()
 
         try:
             with open(output_path, 'w') as json_file:
-                json.dump(data, json_file, indent=4)
+                json_file.write(json.dumps(data, indent=4))
             logging.info(f"Data successfully written to {output_path}")
         except Exception as e:
             logging.error(f"Failed to write data to JSON: {e}")
             raise
 
 
-def run_aspen(model_path, output_dir=None, split_physical_exergy=True):
+def run_aspen(model_path, output_dir=None, split_physical_exergy=True, cache_dir=None, force=False):
     """
     Main function to process the Aspen model and return parsed data.
     Optionally writes the parsed data to a JSON file.
@@ -691,6 +641,9 @@ def run_aspen(model_path, output_dir=None, split_physical_exergy=True):
         model_path (str): Path to the Aspen model file.
         output_dir (str): Optional path where the parsed data should be saved as a JSON file.
         split_physical_exergy (bool): Flag to split physical exergy into thermal and mechanical components.
+        cache_dir (str): Optional directory to cache the parsed data in. If the same model file (identical
+            content) has been parsed before, the cached data is returned without starting Aspen Plus.
+        force (bool): Parse the model even if a cached result exists, and refresh the cache entry.
 
     Returns:
         dict: Parsed data in dictionary format.
@@ -700,20 +653,34 @@ def run_aspen(model_path, output_dir=None, split_physical_exergy=True):
         logging.error(error_msg)
         raise FileNotFoundError(error_msg)
 
+    parsed_data = None
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = model_cache_path(model_path, split_physical_exergy, cache_dir)
+        if not force:
+            parsed_data = read_model_cache(cache_path)
+
     parser = AspenModelParser(model_path, split_physical_exergy=split_physical_exergy)
 
-    try:
-        parser.initialize_model()
-        parser.parse_model()
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise RuntimeError(f"An error occurred: {e}")
+    if parsed_data is None:
+        try:
+            parser.initialize_model()
+            parser.parse_model()
+        except Exception as e:
+            logging.error(f"An error occurred: {e}")
+            raise RuntimeError(f"An error occurred: {e}")
+
+        parsed_data = parser.get_sorted_data()
 
-    parsed_data = parser.get_sorted_data()
+        if cache_path is not None:
+            try:
+                write_model_cache(cache_path, parsed_data)
+            except OSError as e:
+                logging.warning(f"Could not write parse cache {cache_path}: {e}")
 
     if output_dir is not None:
         try:
-            parser.write_to_json(output_dir)
+            parser.write_to_json(output_dir, data=parsed_data)
         except Exception as e:
             logging.error(f"Failed to write output file: {e}")
             raise RuntimeError(f"Failed to write output file: {e}")
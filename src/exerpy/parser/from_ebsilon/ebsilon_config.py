@@ -5,6 +5,8 @@ This script contains the configuration data used by the Ebsilon model parser,
 including lists of component types, fluid types, fluid composition parameters,
 and groups for sorting components into functional categories.
 """
+from operator import attrgetter
+
 from . import __ebsilon_available__
 from .utils import EpSubstanceStub
 
@@ -187,8 +189,8 @@ ebs_objects = {
     169: "Biomass Gasifier"
 }
 
-# Neglected components
-non_thermodynamic_unit_operators = [
+# Neglected components (frozenset for constant-time membership tests in the parser)
+non_thermodynamic_unit_operators = frozenset({
     1,   # Boundary Input Value
     12,  # Controller (with external default value)
     30,  # Difference Meter
@@ -219,7 +221,7 @@ non_thermodynamic_unit_operators = [
     144, # Multivalue Transmitter
     147, # Limiter
     168  # Quantity Converter
-]
+})
 
 # Fluid types of Ebsilon
 fluid_type_index = {
@@ -270,6 +272,14 @@ connection_kinds = {
     "Logic": "heat"
 }
 
+# Fluid types (pipe Kind - 1000) and component numbers that set the kind of a connection
+non_material_fluids = frozenset({5, 6, 9, 10, 13})  # Scheduled, Actual, Electric, Shaft, Logic
+non_energetic_fluids = frozenset({5, 6})  # Scheduled, Actual
+power_fluids = frozenset({9, 10})  # Electric, Shaft
+logic_fluids = 13  # Logic "fluids" for heat and power flows
+heat_components = frozenset({5, 15, 16, 35})  # Components that handle with heat flows as input or output
+power_components = frozenset({31})  # Power-summerized with power flows ONLY as output
+
 # Dictionary mapping stream substance names to EpSubstance identifiers
 substance_mapping = {}
 if __ebsilon_available__:
@@ -813,7 +823,7 @@ unit_id_to_string = {
 
 
 # List of fluid composition materials to include in the JSON file
-composition_params = [
+composition_params = (
     'X12BUTADIEN', 'X13BUTADIEN', 'X1BUTEN', 'X1PENTEN', 'X22DMBUT',
     'X23DMBUT', 'X3MPENT', 'XACET', 'XAIR', 'XAR', 'XASH', 'XASHG',
     'XBENZ', 'XBUT', 'XC', 'XC2BUTEN', 'XCA', 'XCACO3', 'XCAO', 'XCASO4',
@@ -827,25 +837,36 @@ composition_params = [
     'XNO', 'XNO2', 'XNON', 'XO', 'XO2', 'XOCT', 'XOXYLEN', 'XPENT',
     'XPROP', 'XPROPADIEN', 'XPROPEN', 'XS', 'XSO2', 'XT2BUTEN',
     'XTDECALIN', 'XTOLUEN', 'XXE'
-]
+)
+
+# Getters of the composition parameter values of a pipe (pipe.<parameter>.Value), built once at import
+composition_getters = {param: attrgetter(f"{param}.Value") for param in composition_params}
 
 # Define the component groups via unique labels
 grouped_components = {
-    "Turbine": [6, 23, 56, 57, 58, 68, 122],
-    "HeatExchanger": [10, 25, 26, 27, 43, 51, 55, 61, 62, 70, 71, 124, 126],
-    "CombustionChamber": [22, 90],
-    "Valve": [2, 13, 14, 39, 42, 59, 68, 133],
-    "Pump": [8, 44, 83, 159],
-    "Compressor": [24, 94],
-    "Condenser": [7, 47, 78],
-    "Deaerator": [9, 63],
-    "SimpleHeatExchanger": [15, 16, 35],
-    "SteamGenerator": [5],
-    "Mixer": [3, 28, 37, 38, 49, 60, 102, 141, 161],
-    "FlashTank" : [34],
-    "Storage": [118],
-    "Splitter": [4, 17, 18, 19, 52, 109, 140, 157],
-    "CycleCloser": [80]
+    "Turbine": (6, 23, 56, 57, 58, 68, 122),
+    "HeatExchanger": (10, 25, 26, 27, 43, 51, 55, 61, 62, 70, 71, 124, 126),
+    "CombustionChamber": (22, 90),
+    "Valve": (2, 13, 14, 39, 42, 59, 68, 133),
+    "Pump": (8, 44, 83, 159),
+    "Compressor": (24, 94),
+    "Condenser": (7, 47, 78),
+    "Deaerator": (9, 63),
+    "SimpleHeatExchanger": (15, 16, 35),
+    "SteamGenerator": (5,),
+    "Mixer": (3, 28, 37, 38, 49, 60, 102, 141, 161),
+    "FlashTank" : (34,),
+    "Storage": (118,),
+    "Splitter": (4, 17, 18, 19, 52, 109, 140, 157),
+    "CycleCloser": (80,)
+}
+
+# Component group of each Ebsilon component number. Number 68 is listed under both "Turbine" and
+# "Valve"; iterating the groups in reverse lets the earlier group "Turbine" overwrite "Valve".
+component_group_by_id = {
+    type_index: group_name
+    for group_name, type_list in reversed(grouped_components.items())
+    for type_index in type_list
 }
 """
 This is the mapping of component groups to their respective component IDs:
@@ -1077,3 +1098,10 @@ connector_mapping = {
         2: 0,  # Outlet
     },
 }
+
+# Flat lookup of connector_mapping keyed by (component number, Ebsilon connector number)
+connector_port_map = {
+    (type_index, connector): port
+    for type_index, connectors in connector_mapping.items()
+    for connector, port in connectors.items()
+}
@@ -1,8 +1,10 @@
 import logging
 from typing import Any
+from typing import Dict
 from typing import Optional
+from typing import Tuple
 
-from CoolProp.CoolProp import PropsSI as CP
+import CoolProp
 
 from . import __ebsilon_available__
 from .utils import EpGasTableStub
@@ -19,12 +21,179 @@ else:
 
 from exerpy.functions import convert_to_SI
 
+from .ebsilon_config import composition_getters
 from .ebsilon_config import substance_mapping
 from .ebsilon_config import unit_id_to_string
 
+# (fraction getter, Ebsilon substance id) pairs for reading a gas composition from a pipe
+_substance_getters = tuple(
+    (composition_getters[substance_key], ep_substance_id)
+    for substance_key, ep_substance_id in substance_mapping.items()
+)
+
+# (mass composition key, Ebsilon substance id) pairs, for gas compositions already read by the parser
+_substance_ids = tuple(
+    (substance_key.lstrip('X'), ep_substance_id)
+    for substance_key, ep_substance_id in substance_mapping.items()
+)
+
+# Low-level CoolProp state of water, reused for every saturation temperature instead of parsing PropsSI inputs per call
+_water_state = CoolProp.AbstractState('HEOS', 'Water')
+
+
+def _saturation_temperature(pressure: float) -> float:
+    """
+    Calculate the saturation temperature of water.
+
+    Parameters
+    ----------
+    pressure : float
+        The pressure value (in Pa).
+
+    Returns
+    -------
+    float
+        The saturation temperature (in K).
+    """
+    _water_state.update(CoolProp.PQ_INPUTS, pressure, 0)
+    return _water_state.T()
+
+
+# Memoized FluidData objects and property values. They are only valid for the Ebsilon application they
+# were created with: _caches_for() clears them whenever another application is passed, and
+# clear_property_caches() clears them whenever a model is parsed.
+_cache_app = None
+_fluid_data_cache = {}
+_property_cache = {}
+
+
+def clear_property_caches() -> None:
+    """
+    Clear the memoized FluidData objects and property values.
+
+    EbsilonModelParser.parse_model calls this before parsing, so the caches only hold the fluids and states
+    of the model being parsed.
+    """
+    global _cache_app
+    _cache_app = None
+    _fluid_data_cache.clear()
+    _property_cache.clear()
+
+
+def _caches_for(app: Any) -> Tuple[dict, dict]:
+    """
+    Return the FluidData and property caches of an Ebsilon application.
+
+    The caches are cleared first if they were filled with a different application, so FluidData objects
+    and property values are never shared between applications.
+
+    Parameters
+    ----------
+    app : Ebsilon application instance
+        The Ebsilon application used for creating fluid and analysis objects.
+
+    Returns
+    -------
+    tuple of dict
+        The FluidData cache and the property cache.
+    """
+    global _cache_app
+    if app is not _cache_app:
+        clear_property_caches()
+        _cache_app = app
+    return _fluid_data_cache, _property_cache
+
+
+def ebsilon_fluid(pipe: Any, mass_composition: Optional[Dict[str, float]] = None) -> Tuple[int, Any]:
+    """
+    Identify the fluid of a stream by its fluid type and its medium or gas composition.
+
+    Parameters
+    ----------
+    pipe : Stream object
+        The stream object containing fluid and composition information.
+    mass_composition : dict, optional
+        The mass composition of the stream as read by the parser. If given, the fractions of a gas mixture
+        are taken from it instead of being read from the pipe once per substance.
+
+    Returns
+    -------
+    tuple
+        The fluid type and None for steam and water, the medium (FMED) for 2PhaseLiquid, 2PhaseGaseous,
+        salt water and ThermoLiquid streams, or pairs of Ebsilon substance id and non-zero fraction of gas
+        mixtures.
+    """
+    fluid_type = pipe.Kind - 1000
+    if fluid_type in (3, 4):
+        return fluid_type, None
+    if fluid_type in (15, 16, 17, 20):
+        return fluid_type, pipe.FMED.Value
+
+    if mass_composition is None:
+        fractions = ((ep_substance_id, get_fraction(pipe)) for get_fraction, ep_substance_id in _substance_getters)
+    else:
+        fractions = (
+            (ep_substance_id, mass_composition.get(substance, 0)) for substance, ep_substance_id in _substance_ids
+        )
+    # Only set substances with non-zero fractions
+    return fluid_type, tuple((ep_substance_id, fraction) for ep_substance_id, fraction in fractions if fraction > 0)
+
+
+def _fluid_data(app: Any, fluid_type: int, fluid: Any) -> Any:
+    """
+    Create a FluidData object, memoized per application, fluid type and medium or composition.
+
+    Most streams of a model share a few fluids (water/steam, air, fuel, flue gas), and the enthalpy and
+    entropy of a stream are evaluated at the same state. Setting up a gas analysis takes one Ebsilon call
+    per substance. The FluidData object is not modified by the property calls, so it can be reused for
+    any property, pressure and temperature.
+
+    Parameters
+    ----------
+    app : Ebsilon application instance
+        The Ebsilon application used for creating fluid and analysis objects.
+    fluid_type : int
+        The Ebsilon fluid type to evaluate the stream with (3 for steam, 4 for water).
+    fluid : int, tuple or None
+        The medium (FMED) of 2PhaseLiquid, 2PhaseGaseous, salt water and ThermoLiquid streams, pairs of
+        Ebsilon substance id and (non-zero) fraction of gas mixtures, None for steam and water.
+
+    Returns
+    -------
+    FluidData
+        The Ebsilon FluidData object with property table and analysis set.
+    """
+    fluid_data_cache, _ = _caches_for(app)
+    fd = fluid_data_cache.get((fluid_type, fluid))
+    if fd is not None:
+        return fd
+
+    fd = app.NewFluidData()
+    fd.FluidType = fluid_type
+    fdAnalysis = app.NewFluidAnalysis()
+
+    if fluid_type == 3:  # steam
+        fd.SteamTable = EpSteamTable.epSteamTableFromSuperiorModel
+    elif fluid_type in (15, 16, 17, 20):  # 2PhaseLiquid, 2PhaseGaseous, salt water or ThermoLiquid
+        fd.Medium = fluid
+    elif fluid_type != 4:  # flue gas, air etc.
+        fd.GasTable = EpGasTable.epGasTableFromSuperiorModel
+        # Set up the fluid analysis based on stream composition
+        set_substance = fdAnalysis.SetSubstance  # bind the COM method once for all substances
+        for ep_substance_id, fraction in fluid:
+            set_substance(ep_substance_id, fraction)
+
+    # Set the analysis in the FluidData object
+    fd.SetAnalysis(fdAnalysis)
+
+    fluid_data_cache[(fluid_type, fluid)] = fd
+    return fd
+
 
 @require_ebsilon
-def calc_X_from_PT(app: Any, pipe: Any, property: str, pressure: float, temperature: float) -> Optional[float]:
+def calc_X_from_PT(
+    app: Any, pipe: Any, property: str, pressure: float, temperature: float, fluid: Optional[Tuple[int, Any]] = None
+) -> Optional[float]:
     """
     Calculate a thermodynamic property (enthalpy or entropy) for a given stream based on pressure and temperature.
 
@@ -44,6 +213,9 @@ def calc_X_from_PT(app: Any, pipe: Any, property: str, pressure: float, temperat
         The pressure value (in bar).
     temperature : float
         The temperature value (in °C).
+    fluid : tuple, optional
+        The fluid of the stream as returned by ebsilon_fluid. Passing it avoids reading the gas composition
+        from the pipe on every call.
 
     Returns
     -------
@@ -59,67 +231,35 @@ def calc_X_from_PT(app: Any, pipe: Any, property: str, pressure: float, temperat
         Logs an error and returns None if any other exception occurs during property calculation.
     """
 
-    # Create a new FluidData object
-    fd = app.NewFluidData()
-
-    # Retrieve the fluid type from the stream
-    fd.FluidType = (pipe.Kind-1000)
-
-    if fd.FluidType == 3 or fd.FluidType == 4:  # steam or water
-            t_sat = CP('T', 'P', pressure, 'Q', 0, 'water')
-            if temperature > t_sat:
-                fd.FluidType = 3  # steam
-                fd.SteamTable = EpSteamTable.epSteamTableFromSuperiorModel
-                fdAnalysis = app.NewFluidAnalysis()
-            else:
-                fd.FluidType == 4  # water
-                fdAnalysis = app.NewFluidAnalysis()
-
-    elif fd.FluidType == 15:  # 2PhaseLiquid
-        fd.Medium = pipe.FMED.Value
-        fdAnalysis = app.NewFluidAnalysis()
-
-    elif fd.FluidType == 16:  # 2PhaseGaseous
-        fd.Medium = pipe.FMED.Value
-        fdAnalysis = app.NewFluidAnalysis()
-
-    elif fd.FluidType == 17:  # Salt water
-        fd.Medium = pipe.FMED.Value
-        fdAnalysis = app.NewFluidAnalysis()
-
-    elif fd.FluidType == 20:  # ThermoLiquid
-        fd.Medium = pipe.FMED.Value
-        fdAnalysis = app.NewFluidAnalysis()
-        
-    else:  # flue gas, air etc.
-        fd.GasTable = EpGasTable.epGasTableFromSuperiorModel
+    # Validate property input before any Ebsilon call is made
+    if property not in ('S', 'H'):
+        logging.error('Invalid property selected. You can choose between "H" (enthalpy) and "S" (entropy).')
+        return None
 
-        # Set up the fluid analysis based on stream composition
-        fdAnalysis = app.NewFluidAnalysis()
+    # Identify the fluid by its type and, for gas mixtures, its composition. Streams sharing the fluid
+    # reuse a property computed at the same state, e.g. the ambient state of calc_eT.
+    if fluid is None:
+        fluid = ebsilon_fluid(pipe)
+    fluid_type = fluid[0]
 
-        # Iterate through the substance_mapping and get the corresponding value from the pipe
-        for substance_key, ep_substance_id in substance_mapping.items():
-            fraction = getattr(pipe, substance_key).Value  # Dynamically access the fraction
-            if fraction > 0:  # Only set substances with non-zero fractions
-                fdAnalysis.SetSubstance(ep_substance_id, fraction)
+    _, property_cache = _caches_for(app)
+    state = (fluid, property, pressure, temperature)
+    if state in property_cache:
+        return property_cache[state]
 
-    # Set the analysis in the FluidData object
-    fd.SetAnalysis(fdAnalysis)
-
-    # Validate property input
-    if property not in ['S', 'H']:
-        logging.error('Invalid property selected. You can choose between "H" (enthalpy) and "S" (entropy).')
-        return None
+    if fluid_type in (3, 4):  # steam or water, depending on the state
+        fluid_type = 3 if temperature > _saturation_temperature(pressure) else 4
+    fd = _fluid_data(app, fluid_type, fluid[1])
 
     try:
         # Calculate the property based on the input property type
         if property == 'S':  # Entropy
             res = fd.PropertyS_OF_PT(pressure * 1e-5, temperature - 273.15)  # Ebsilon works with °C and bar
             res_SI = res * 1e3  # Convert kJ/kgK to J/kgK
-        elif property == 'H':  # Enthalpy
+        else:  # Enthalpy
             res = fd.PropertyH_OF_PT(pressure * 1e-5, temperature - 273.15)  # Ebsilon works with °C and bar
             res_SI = res * 1e3  # Convert kJ/kg to J/kg
-        
+
         if res == -999.0:
             raise ValueError(
                 f"Calculation with Ebsilon property failed: {property} = -999.0 "
@@ -127,6 +267,7 @@ def calc_X_from_PT(app: Any, pipe: Any, property: str, pressure: float, temperat
                 f"It may helpful to set split_physical_exergy=False in the ExergyAnalysis constructor."
             )
 
+        property_cache[state] = res_SI
         return res_SI
 
     except Exception as e:
@@ -137,7 +278,9 @@ def calc_X_from_PT(app: Any, pipe: Any, property: str, pressure: float, temperat
 
 
 @require_ebsilon
-def calc_eT(app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float) -> float:
+def calc_eT(
+    app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float, fluid: Optional[Tuple[int, Any]] = None
+) -> float:
     """
     Calculate the thermal component of physical exergy.
 
@@ -153,16 +296,21 @@ def calc_eT(app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float) -> f
         The ambient temperature (in K).
     pamb : float
         The ambient pressure (in Pa).
+    fluid : tuple, optional
+        The fluid of the stream as returned by ebsilon_fluid. It is identified from the pipe if not given.
 
     Returns
     -------
     float
         The thermal exergy component (in J/kg).
     """
-    h_i = convert_to_SI('h', pipe.H.Value, unit_id_to_string.get(pipe.H.Dimension, "Unknown"))  # in SI unit [J / kg]
-    s_i = convert_to_SI('s', pipe.S.Value, unit_id_to_string.get(pipe.S.Dimension, "Unknown"))  # in SI unit [J / kgK]
-    h_A = calc_X_from_PT(app, pipe, 'H', pressure, Tamb)  # in SI unit [J / kg]
-    s_A = calc_X_from_PT(app, pipe, 'S', pressure, Tamb)  # in SI unit [J / kgK]
+    H, S = pipe.H, pipe.S  # resolve each result object once for its value and dimension
+    h_i = convert_to_SI('h', H.Value, unit_id_to_string.get(H.Dimension, "Unknown"))  # in SI unit [J / kg]
+    s_i = convert_to_SI('s', S.Value, unit_id_to_string.get(S.Dimension, "Unknown"))  # in SI unit [J / kgK]
+    if fluid is None:
+        fluid = ebsilon_fluid(pipe)  # read the composition once for both properties
+    h_A = calc_X_from_PT(app, pipe, 'H', pressure, Tamb, fluid)  # in SI unit [J / kg]
+    s_A = calc_X_from_PT(app, pipe, 'S', pressure, Tamb, fluid)  # in SI unit [J / kgK]
     eT = h_i - h_A - Tamb * (s_i - s_A)  # in SI unit [J / kg]
 
     return eT
@@ -191,6 +339,7 @@ def calc_eM(app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float) -> f
     float
         The mechanical exergy component (in J/kg).
     """
-    eM = convert_to_SI('e', pipe.E.Value, unit_id_to_string.get(pipe.E.Dimension, "Unknown")) - calc_eT(app, pipe, pressure, Tamb, pamb)
+    E = pipe.E  # resolve the result object once for its value and dimension
+    eM = convert_to_SI('e', E.Value, unit_id_to_string.get(E.Dimension, "Unknown")) - calc_eT(app, pipe, pressure, Tamb, pamb)
 
     return eM
\ No newline at end of file
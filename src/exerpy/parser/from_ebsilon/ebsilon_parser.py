@@ -14,6 +14,9 @@ from typing import Optional
 
 from exerpy.functions import convert_to_SI
 from exerpy.functions import fluid_property_data
+from exerpy.functions import model_cache_path
+from exerpy.functions import read_model_cache
+from exerpy.functions import write_model_cache
 
 from . import __ebsilon_available__
 from . import is_ebsilon_available
@@ -37,19 +40,61 @@ else:
     EpGasTable = EpGasTableStub
     EpCalculationResultStatus2 = EpCalculationResultStatus2Stub
 
-from .ebsilon_config import composition_params
+from .ebsilon_config import component_group_by_id
+from .ebsilon_config import composition_getters
 from .ebsilon_config import connection_kinds
 from .ebsilon_config import connector_mapping
+from .ebsilon_config import connector_port_map
 from .ebsilon_config import ebs_objects
 from .ebsilon_config import fluid_type_index
-from .ebsilon_config import grouped_components
+from .ebsilon_config import heat_components
+from .ebsilon_config import logic_fluids
+from .ebsilon_config import non_energetic_fluids
+from .ebsilon_config import non_material_fluids
 from .ebsilon_config import non_thermodynamic_unit_operators
+from .ebsilon_config import power_components
+from .ebsilon_config import power_fluids
 from .ebsilon_config import two_phase_fluids_mapping
 from .ebsilon_config import unit_id_to_string
 
 # Configure logging to display info-level messages
 logging.basicConfig(level=logging.ERROR)
 
+# (connection data key, quantity in fluid_property_data, pipe attribute) of the material stream results
+_material_pipe_properties = (
+    ('m', 'm', 'M'),
+    ('T', 'T', 'T'),
+    ('p', 'p', 'P'),
+    ('h', 'h', 'H'),
+    ('s', 's', 'S'),
+    ('e_PH', 'e', 'E'),
+    ('x', 'x', 'X'),
+    ('VM', 'VM', 'VM'),
+)
+
+def _read_in_SI(obj: Any, attribute: str, quantity: str) -> Optional[float]:
+    """
+    Read a result value of an Ebsilon object and convert it to SI units.
+
+    The result object is resolved once, so the COM attribute lookup is not repeated
+    for the availability check, the value and its dimension.
+
+    Parameters:
+        obj: The Ebsilon object (e.g. a pipe) holding the result.
+        attribute (str): Name of the result attribute, e.g. 'M'.
+        quantity (str): Quantity of the value as used in convert_to_SI, e.g. 'm'.
+
+    Returns:
+        Optional[float]: The value in SI units, or None if the object has no such result.
+    """
+    result = getattr(obj, attribute, None)
+    if result is None:
+        return None
+    value = result.Value
+    if value is None:
+        return None
+    return convert_to_SI(quantity, value, unit_id_to_string.get(result.Dimension, "Unknown"))
+
 
 class EbsilonModelParser:
     """
@@ -156,6 +201,11 @@ class EbsilonModelParser:
             ValueError: If ambient conditions are not set.
             Exception: If model parsing fails.
         """
+        from .ebsilon_functions import clear_property_caches
+
+        # Start with empty property caches, so FluidData objects of another model or application are not reused
+        clear_property_caches()
+
         try:
             total_objects = self.model.Objects.Count
             logging.info(f"Parsing {total_objects} objects from the model")
@@ -199,20 +249,12 @@ class EbsilonModelParser:
         Parameters:
             obj: The Ebsilon component object whose connections are to be parsed.
         """
-        from .ebsilon_functions import calc_eM
         from .ebsilon_functions import calc_eT
+        from .ebsilon_functions import ebsilon_fluid
 
         # Cast the pipe to the correct type
         pipe_cast = self.oc.CastToPipe(obj)
 
-        # Define fluid types that are considered non-material or non-energetic
-        non_material_fluids = {5, 6, 9, 10, 13}  # Scheduled, Actual, Electric, Shaft, Logic
-        non_energetic_fluids = {5, 6}  # Scheduled, Actual
-        power_fluids = {9, 10}  # Electric, Shaft
-        logic_fluids = 13  # Logic "fluids" for heat and power flows
-        heat_components = {5, 15, 16, 35}  # Components that handle with heat flows as input or output
-        power_components = {31}  # Power-summerized with power flows ONLY as output
-
         # ALL EBSILON CONNECTIONS
         # Initialize connection data with the common fields
         connection_data = {
@@ -250,113 +292,51 @@ class EbsilonModelParser:
             # MATERIAL CONNECTIONS
             if (pipe_cast.Kind - 1000) not in non_material_fluids:
                 # Retrieve all data and convert them in SI units
-                connection_data.update({
-                    'kind': 'material',
-                    'm': (
-                        convert_to_SI(
-                            'm',
-                            pipe_cast.M.Value,
-                            unit_id_to_string.get(pipe_cast.M.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'M') and pipe_cast.M.Value is not None else None
-                    ),
-                    'm_unit': fluid_property_data['m']['SI_unit'],
-
-                    'T': (
-                        convert_to_SI(
-                            'T',
-                            pipe_cast.T.Value,
-                            unit_id_to_string.get(pipe_cast.T.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'T') and pipe_cast.T.Value is not None else None
-                    ),
-                    'T_unit': fluid_property_data['T']['SI_unit'],
-
-                    'p': (
-                        convert_to_SI(
-                            'p',
-                            pipe_cast.P.Value,
-                            unit_id_to_string.get(pipe_cast.P.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'P') and pipe_cast.P.Value is not None else None
-                    ),
-                    'p_unit': fluid_property_data['p']['SI_unit'],
-
-                    'h': (
-                        convert_to_SI(
-                            'h',
-                            pipe_cast.H.Value,
-                            unit_id_to_string.get(pipe_cast.H.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'H') and pipe_cast.H.Value is not None else None
-                    ),
-                    'h_unit': fluid_property_data['h']['SI_unit'],
-
-                    's': (
-                        convert_to_SI(
-                            's',
-                            pipe_cast.S.Value,
-                            unit_id_to_string.get(pipe_cast.S.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'S') and pipe_cast.S.Value is not None else None
-                    ),
-                    's_unit': fluid_property_data['s']['SI_unit'],
-
-                    'e_PH': (
-                        convert_to_SI(
-                            'e',
-                            pipe_cast.E.Value,
-                            unit_id_to_string.get(pipe_cast.E.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'E') and pipe_cast.E.Value is not None else None
-                    ),
-                    'e_PH_unit': fluid_property_data['e']['SI_unit'],
-
-                    'x': (
-                        convert_to_SI(
-                            'x',
-                            pipe_cast.X.Value,
-                            unit_id_to_string.get(pipe_cast.X.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'X') and pipe_cast.X.Value is not None else None
-                    ),
-                    'x_unit': fluid_property_data['x']['SI_unit'],
-
-                    'VM': (
-                        convert_to_SI(
-                            'VM',
-                            pipe_cast.VM.Value,
-                            unit_id_to_string.get(pipe_cast.VM.Dimension, "Unknown")
-                        ) if hasattr(pipe_cast, 'VM') and pipe_cast.VM.Value is not None else None
-                    ),
-                    'VM_unit': fluid_property_data['VM']['SI_unit'],
-                })
-
-                # Add the mechanical and thermal specific exergies unless the flag is set to False
-                if self.split_physical_exergy:
-                    e_T_value = calc_eT(self.app, pipe_cast, connection_data['p'], self.Tamb, self.pamb)
-                    e_M_value = calc_eM(self.app, pipe_cast, connection_data['p'], self.Tamb, self.pamb)
-
-                    connection_data.update({
-                        'e_T': e_T_value,
-                        'e_T_unit': fluid_property_data['e']['SI_unit'],
-                        'e_M': e_M_value,
-                        'e_M_unit': fluid_property_data['e']['SI_unit']
-                    })
+                connection_data['kind'] = 'material'
+                for key, quantity, attribute in _material_pipe_properties:
+                    connection_data[key] = _read_in_SI(pipe_cast, attribute, quantity)
+                    connection_data[f'{key}_unit'] = fluid_property_data[quantity]['SI_unit']
 
                 # Handle mass composition logic for fluids
                 if fluid_type_index.get(pipe_cast.FluidType, "Unknown") in ['Steam', 'Water']:
-                    connection_data['mass_composition'] = {'H2O': 1}
+                    mass_composition = {'H2O': 1}
                 elif fluid_type_index.get(pipe_cast.FluidType, "Unknown") in ['2PhaseLiquid', '2PhaseGaseous']:
                     # Get the FMED value to determine the substance
                     fmed_value = pipe_cast.FMED.Value if hasattr(pipe_cast, 'FMED') else None
                     if fmed_value in two_phase_fluids_mapping.keys():
-                        connection_data['mass_composition'] = two_phase_fluids_mapping[fmed_value]
+                        mass_composition = two_phase_fluids_mapping[fmed_value]
                     else:
-                        connection_data['mass_composition'] = {}  # Default if no mapping found
+                        mass_composition = {}  # Default if no mapping found
                         logging.warning(f"FMED value {fmed_value} not found in fluid_composition_mapping. Please add it.")
                 elif fluid_type_index.get(pipe_cast.FluidType, "Unknown") in ['ThermoLiquid']:
                     # For oil, we assume a default composition
-                    connection_data['mass_composition'] = {'ThermoLiquid': 1}
+                    mass_composition = {'ThermoLiquid': 1}
                 else:
-                    connection_data['mass_composition'] = {
-                        param.lstrip('X'): getattr(pipe_cast, param).Value
-                        for param in composition_params
-                        if hasattr(pipe_cast, param) and getattr(pipe_cast, param).Value not in [0, None]
-                    }
+                    mass_composition = {}
+                    for param, get_fraction in composition_getters.items():
+                        try:
+                            fraction = get_fraction(pipe_cast)
+                        except AttributeError:  # the pipe has no such composition parameter
+                            continue
+                        if fraction not in (0, None):
+                            mass_composition[param.lstrip('X')] = fraction
+
+                # Add the mechanical and thermal specific exergies unless the flag is set to False
+                if self.split_physical_exergy:
+                    # Identify the fluid from the composition read above instead of reading it from the pipe again
+                    fluid = ebsilon_fluid(pipe_cast, mass_composition)
+                    e_T_value = calc_eT(self.app, pipe_cast, connection_data['p'], self.Tamb, self.pamb, fluid)
+                    # As in calc_eM, but without evaluating e_T a second time
+                    e_M_value = connection_data['e_PH'] - e_T_value
+
+                    connection_data.update({
+                        'e_T': e_T_value,
+                        'e_T_unit': fluid_property_data['e']['SI_unit'],
+                        'e_M': e_M_value,
+                        'e_M_unit': fluid_property_data['e']['SI_unit']
+                    })
+
+                connection_data['mass_composition'] = mass_composition
 
             # HEAT AND POWER CONNECTIONS from Logic "fluids"
             if (pipe_cast.Kind - 1000) == logic_fluids:
@@ -388,11 +368,14 @@ class EbsilonModelParser:
                     })
 
             # Convert the connector numbers to selected standard values for each component
-            if connection_data['source_component_type'] in connector_mapping and connection_data['source_connector'] in connector_mapping[connection_data['source_component_type']]:
-                connection_data['source_connector'] = connector_mapping[connection_data['source_component_type']][connection_data['source_connector']]
-
-            if connection_data['target_component_type'] in connector_mapping and connection_data['target_connector'] in connector_mapping[connection_data['target_component_type']]:
-                connection_data['target_connector'] = connector_mapping[connection_data['target_component_type']][connection_data['target_connector']]
+            connection_data['source_connector'] = connector_port_map.get(
+                (connection_data['source_component_type'], connection_data['source_connector']),
+                connection_data['source_connector']
+            )
+            connection_data['target_connector'] = connector_port_map.get(
+                (connection_data['target_component_type'], connection_data['target_connector']),
+                connection_data['target_connector']
+            )
 
             # Store the connection data
             self.connections_data[obj.Name] = connection_data
@@ -506,16 +489,9 @@ class EbsilonModelParser:
                 'energy_flow_1_unit': fluid_property_data['heat']['SI_unit'],
             }
 
-            # Determine the group for the component based on its type
-            group = None
-            for group_name, type_list in grouped_components.items():
-                if type_index in type_list:
-                    group = group_name
-                    break
-
-            # If the component type doesn't belong to any predefined group, use its type name
-            if not group:
-                group = type_name
+            # Determine the group for the component based on its type. If the component type
+            # doesn't belong to any predefined group, use its type name
+            group = component_group_by_id.get(type_index, type_name)
 
             # Initialize the group in the components_data dictionary if not already present
             if group not in self.components_data:
@@ -637,28 +613,35 @@ class EbsilonModelParser:
         }
 
 
-    def write_to_json(self, output_path: str):
+    def write_to_json(self, output_path: str, data: Optional[Dict[str, Any]] = None):
         """
         Writes the parsed and sorted data to a JSON file.
 
         Parameters:
             output_path (str): Path where the JSON file will be saved.
+            data (dict): Optional data to write, as returned by get_sorted_data. If None, it is built from the parsed model.
 
         Raises:
             Exception: If writing to JSON fails.
         """
-        data = self.get_sorted_data()
+        if data is None:
+            data = self.get_sorted_data()
         try:
-            # Write the data to a JSON file with indentation for readability
             with open(output_path, 'w') as json_file:
-                json.dump(data, json_file, indent=4)
+                json_file.write(json.dumps(data, indent=4))
             logging.info(f"Data successfully written to {output_path}")
         except Exception as e:
             logging.error(f"Failed to write data to JSON: {e}")
             raise
 
 
-def run_ebsilon(model_path: str, output_dir: Optional[str] = None, split_physical_exergy: bool = True) -> Dict[str, Any]:
+def run_ebsilon(
+    model_path: str,
+    output_dir: Optional[str] = None,
+    split_physical_exergy: bool = True,
+    cache_dir: Optional[str] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
     """
     Main function to process the Ebsilon model and return parsed data.
     Optionally writes the parsed data to a JSON file.
@@ -667,6 +650,9 @@ def run_ebsilon(model_path: str, output_dir: Optional[str] = None, split_physica
         model_path (str): Path to the Ebsilon model file.
         output_dir (str): Optional path where the parsed data should be saved as a JSON file.
         split_physical_exergy (bool): Flag to split physical exergy into thermal and mechanical components.
+        cache_dir (str): Optional directory to cache the parsed data in. If the same model file (identical
+            content) has been parsed before, the cached data is returned without simulating the model.
+        force (bool): Simulate and parse the model even if a cached result exists, and refresh the cache entry.
 
     Returns:
         dict: Parsed data in dictionary format.
@@ -688,6 +674,13 @@ def run_ebsilon(model_path: str, output_dir: Optional[str] = None, split_physica
         logging.error(error_msg)
         raise FileNotFoundError(error_msg)
 
+    parsed_data = None
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = model_cache_path(model_path, split_physical_exergy, cache_dir)
+        if not force:
+            parsed_data = read_model_cache(cache_path)
+
     # Initialize the Ebsilon model parser with the model file path
     try:
         parser = EbsilonModelParser(model_path, split_physical_exergy=split_physical_exergy)
@@ -696,43 +689,50 @@ def run_ebsilon(model_path: str, output_dir: Optional[str] = None, split_physica
         logging.error(f"Failed to initialize EbsilonModelParser: {e}")
         raise
 
-    try:
-        # Initialize the Ebsilon model within the parser
-        parser.initialize_model()
-    except FileNotFoundError:
-    # allow an invalid/corrupt‐model file to bubble up as FileNotFoundError
-        raise
-    except Exception as e:
-        # other COM/server errors should still be RuntimeErrors
-        error_msg = f"File not found: {model_path}"
-        logging.error(error_msg)
-        raise RuntimeError(error_msg)
+    if parsed_data is None:
+        try:
+            # Initialize the Ebsilon model within the parser
+            parser.initialize_model()
+        except FileNotFoundError:
+        # allow an invalid/corrupt‐model file to bubble up as FileNotFoundError
+            raise
+        except Exception as e:
+            # other COM/server errors should still be RuntimeErrors
+            error_msg = f"File not found: {model_path}"
+            logging.error(error_msg)
+            raise RuntimeError(error_msg)
 
-    try:
-        # Simulate the Ebsilon model
-        parser.simulate_model()
-    except Exception as e:
-        # Log and raise an error if something goes wrong during simulation
-        error_msg = f"An error occurred during model simulation: {e}"
-        logging.error(error_msg)
-        raise RuntimeError(error_msg)
+        try:
+            # Simulate the Ebsilon model
+            parser.simulate_model()
+        except Exception as e:
+            # Log and raise an error if something goes wrong during simulation
+            error_msg = f"An error occurred during model simulation: {e}"
+            logging.error(error_msg)
+            raise RuntimeError(error_msg)
 
-    try:
-        # Parse data from the simulated model
-        parser.parse_model()
-    except Exception as e:
-        # Log and raise an error if something goes wrong during parsing
-        error_msg = f"An error occurred during model parsing: {e}"
-        logging.error(error_msg)
-        raise RuntimeError(error_msg)
+        try:
+            # Parse data from the simulated model
+            parser.parse_model()
+        except Exception as e:
+            # Log and raise an error if something goes wrong during parsing
+            error_msg = f"An error occurred during model parsing: {e}"
+            logging.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        # Get the parsed and sorted data
+        parsed_data = parser.get_sorted_data()
 
-    # Get the parsed and sorted data
-    parsed_data = parser.get_sorted_data()
+        if cache_path is not None:
+            try:
+                write_model_cache(cache_path, parsed_data)
+            except OSError as e:
+                logging.warning(f"Could not write parse cache {cache_path}: {e}")
 
     if output_dir is not None:
         try:
             # Write the parsed data to the JSON file
-            parser.write_to_json(output_dir)
+            parser.write_to_json(output_dir, data=parsed_data)
             logging.info(f"Data successfully written to {output_dir}")
         except Exception as e:
             # Log and raise an error if something goes wrong while writing the output file
@@ -3,7 +3,6 @@ EXERPY_TESPY_MAPPINGS = {
     "HeatExchanger": "HeatExchanger",
     "MovingBoundaryHeatExchanger": "HeatExchanger",
     "Desuperheater": "HeatExchanger",
-    "MovingBoundaryHeatExchanger": "HeatExchanger",
     "Condenser": "Condenser",
     "SimpleHeatExchanger": "SimpleHeatExchanger",
     "ParabolicTrough": "SimpleHeatExchanger",
@@ -28,7 +27,6 @@ This is the mapping of component groups to their name in TESPy:
     - "HeatExchanger": "HeatExchanger",
     - "MovingBoundaryHeatExchanger": "HeatExchanger",
     - "Desuperheater": "HeatExchanger",
-    - "MovingBoundaryHeatExchanger": "HeatExchanger",
     - "Condenser": "Condenser",
     - "SimpleHeatExchanger": "SimpleHeatExchanger",
     - "ParabolicTrough": "SimpleHeatExchanger",
@@ -333,146 +333,67 @@ def deaerator():
     """
     return Deaerator()
 
-# --- Test Case 1: Outlet temperature greater than ambient ---
-@pytest.fixture
-def deaerator_streams_outlet_above():
-    """
-    Create dummy inlet and outlet data for a deaerator where the outlet temperature (T_out)
-    is greater than the ambient temperature (T0).
-
-    In this case, for each inlet:
-      - If T_in < T_out and T_in >= T0:
-          E_P contribution = m * (e_PH_out - e_PH_in)
-      - If T_in < T0:
-          E_P contribution = m * e_PH_out, and E_F contribution = m * e_PH_in
-      - Otherwise (T_in > T_out) add to E_F: m * (e_PH_in - e_PH_out)
-
-    For this test we choose:
-      T0 = 300 K,
-      Outlet: T = 320 K, e_PH = 950
-      Inlet0: T = 310 K, m = 10, e_PH = 900   → T_in>=T0, T_in < T_out, so: contribution = 10*(950-900)=500
-      Inlet1: T = 290 K, m = 5, e_PH = 800    → T_in < T0, so: E_P += 5*950 = 4750 and E_F += 5*800 = 4000
-
-    Expected:
-      E_P = 500 + 4750 = 5250 W,
-      E_F = 4000 W,
-      E_D = E_F - E_P = 4000 - 5250 = -1250 W.
+# Both inlets are shared by all outlet temperature cases; the ambient temperature is T0 = 300 K.
+#   Inlet0: T = 310 K, m = 10, e_PH = 900
+#   Inlet1: T = 290 K, m = 5, e_PH = 800
+DEAERATOR_INLETS = {
+    0: {"T": 310, "m": 10, "e_PH": 900},
+    1: {"T": 290, "m": 5, "e_PH": 800}
+}
+
+DEAERATOR_CASES = [
+    # Outlet temperature greater than ambient (T = 320 K, e_PH = 950):
+    #   Inlet0: T_in >= T0 and T_in < T_out, so E_P += 10 * (950 - 900) = 500
+    #   Inlet1: T_in < T0, so E_P += 5 * 950 = 4750 and E_F += 5 * 800 = 4000
+    #   E_P = 5250, E_F = 4000, E_D = E_F - E_P = -1250
+    pytest.param(
+        {0: {"T": 320, "m": 1, "e_PH": 950}},  # mass here is not used in calculation
+        10 * (950 - 900) + 5 * 950,
+        5 * 800,
+        id="outlet_above"
+    ),
+    # Outlet temperature equal to ambient (T = 300 K):
+    #   E_P is NaN and E_F is the sum over all inlets: 10 * 900 + 5 * 800 = 13000
+    #   E_D = E_F = 13000, and epsilon is NaN
+    pytest.param(
+        {0: {"T": 300, "m": 1, "e_PH": 850}},  # e_PH here is irrelevant since T_out == T0
+        np.nan,
+        10 * 900 + 5 * 800,
+        id="outlet_equal"
+    ),
+    # Outlet temperature below ambient (T = 290 K, e_PH = 280):
+    #   Inlet0: T_in >= T0, so E_P += 10 * 280 = 2800 and E_F += 10 * 900 = 9000
+    #   Inlet1: T_in == T_out falls into else, so E_F += 5 * (800 - 280) = 2600
+    #   E_P = 2800, E_F = 11600, E_D = 8800
+    pytest.param(
+        {0: {"T": 290, "m": 1, "e_PH": 280}},
+        10 * 280,
+        10 * 900 + 5 * (800 - 280),
+        id="outlet_below"
+    ),
+]
+
+@pytest.mark.parametrize("outl, expected_E_P, expected_E_F", DEAERATOR_CASES)
+def test_deaerator_calc_exergy_balance(deaerator, outl, expected_E_P, expected_E_F):
+    """
+    Test the deaerator exergy balance for outlet temperatures above, equal to and below ambient.
     """
-    inlets = {
-        0: {"T": 310, "m": 10, "e_PH": 900},
-        1: {"T": 290, "m": 5, "e_PH": 800}
-    }
-    outlets = {
-        0: {"T": 320, "m": 1, "e_PH": 950}  # mass here is not used in calculation
-    }
-    return inlets, outlets
-
-def test_deaerator_outlet_above(deaerator, deaerator_streams_outlet_above):
     T0 = 300
     p0 = 101325
-    inl, outl = deaerator_streams_outlet_above
-    deaerator.inl = inl
+    deaerator.inl = DEAERATOR_INLETS
     deaerator.outl = outl
 
     deaerator.calc_exergy_balance(T0, p0, split_physical_exergy=True)
 
-    expected_E_P = 10 * (950 - 900) + 5 * 950   # 500 + 4750 = 5250
-    expected_E_F = 5 * 800                      # 4000
-    expected_E_D = expected_E_F - expected_E_P   # 4000 - 5250 = -1250
-
-    assert deaerator.E_P == pytest.approx(expected_E_P, rel=1e-3)
-    assert deaerator.E_F == pytest.approx(expected_E_F, rel=1e-3)
-    assert deaerator.E_D == pytest.approx(expected_E_D, rel=1e-3)
-
-# --- Test Case 2: Outlet temperature equal to ambient ---
-@pytest.fixture
-def deaerator_streams_outlet_equal():
-    """
-    Create dummy stream data where the outlet temperature equals the ambient temperature.
-
-    For this case, the code sets:
-      - E_P = NaN
-      - E_F is the sum over all inlets: m * e_PH
-
-    Let T0 = 300 K, outlet: T = 300 K.
-      Inlet0: T = 310 K, m = 10, e_PH = 900   → contribution = 10 * 900 = 9000
-      Inlet1: T = 290 K, m = 5, e_PH = 800    → contribution = 5 * 800 = 4000
-
-    Expected:
-      E_F = 9000 + 4000 = 13000 W,
-      E_P = NaN, and E_D = E_F (13000 W).
-    """
-    inlets = {
-        0: {"T": 310, "m": 10, "e_PH": 900},
-        1: {"T": 290, "m": 5, "e_PH": 800}
-    }
-    outlets = {
-        0: {"T": 300, "m": 1, "e_PH": 850}  # e_PH here is irrelevant since T_out == T0
-    }
-    return inlets, outlets
-
-def test_deaerator_outlet_equal(deaerator, deaerator_streams_outlet_equal):
-    T0 = 300
-    p0 = 101325
-    inl, outl = deaerator_streams_outlet_equal
-    deaerator.inl = inl
-    deaerator.outl = outl
-
-    deaerator.calc_exergy_balance(T0, p0, split_physical_exergy=True)
-
-    expected_E_F = 10 * 900 + 5 * 800  # 9000 + 4000 = 13000
-    assert np.isnan(deaerator.E_P)
-    assert deaerator.E_F == pytest.approx(expected_E_F, rel=1e-3)
-    assert deaerator.E_D == pytest.approx(expected_E_F, rel=1e-3)
-    # Efficiency is not defined when E_P is NaN; assume calc_epsilon returns NaN.
-    assert np.isnan(deaerator.epsilon)
-
-# --- Test Case 3: Outlet temperature below ambient ---
-@pytest.fixture
-def deaerator_streams_outlet_below():
-    """
-    Create dummy stream data where the outlet temperature is below the ambient temperature.
-
-    Let T0 = 300 K, outlet: T = 290 K, e_PH = 280.
-    For each inlet:
-      - If T_in > T_out:
-          if T_in >= T0, then E_P += m * e_PH_out and E_F += m * e_PH_in.
-          If T_in < T0, then E_P += m * (e_PH_out - e_PH_in).
-    
-    For this test, choose:
-      Inlet0: T = 310 K, m = 10, e_PH = 900   → T_in >= T0 so: E_P += 10 * 280 = 2800, E_F += 10 * 900 = 9000.
-      Inlet1: T = 290 K, m = 5, e_PH = 800    → T_in == outlet T so: falls into else: E_F += 5*(800 - 280) = 5*520 = 2600.
-    
-    Expected:
-      E_P = 2800,
-      E_F = 9000 + 2600 = 11600,
-      E_D = 11600 - 2800 = 8800.
-    """
-    inlets = {
-        0: {"T": 310, "m": 10, "e_PH": 900},
-        1: {"T": 290, "m": 5, "e_PH": 800}
-    }
-    outlets = {
-        0: {"T": 290, "m": 1, "e_PH": 280}
-    }
-    return inlets, outlets
-
-def test_deaerator_outlet_below(deaerator, deaerator_streams_outlet_below):
-    T0 = 300
-    p0 = 101325
-    inl, outl = deaerator_streams_outlet_below
-    deaerator.inl = inl
-    deaerator.outl = outl
-
-    deaerator.calc_exergy_balance(T0, p0, split_physical_exergy=True)
-
-    expected_E_P = 10 * 280   # Only inlet0 contributes: 2800
-    expected_E_F = 10 * 900 + 5 * (800 - 280)  # 9000 + 2600 = 11600
-    expected_E_D = expected_E_F - expected_E_P  # 11600 - 2800 = 8800
-
-    assert deaerator.E_P == pytest.approx(expected_E_P, rel=1e-3)
     assert deaerator.E_F == pytest.approx(expected_E_F, rel=1e-3)
-    assert deaerator.E_D == pytest.approx(expected_E_D, rel=1e-3)
+    if np.isnan(expected_E_P):
+        # Without a product, E_D equals E_F and the efficiency is not defined.
+        assert np.isnan(deaerator.E_P)
+        assert deaerator.E_D == pytest.approx(expected_E_F, rel=1e-3)
+        assert np.isnan(deaerator.epsilon)
+    else:
+        assert deaerator.E_P == pytest.approx(expected_E_P, rel=1e-3)
+        assert deaerator.E_D == pytest.approx(expected_E_F - expected_E_P, rel=1e-3)
 
 def test_deaerator_missing_temperature():
     """Test that calc_exergy_balance raises a KeyError when temperature is missing."""
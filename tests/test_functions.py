@@ -17,6 +17,9 @@ from exerpy.functions import add_total_exergy_flow
 from exerpy.functions import calc_chemical_exergy
 from exerpy.functions import convert_to_SI
 from exerpy.functions import mass_to_molar_fractions
+from exerpy.functions import model_cache_path
+from exerpy.functions import read_model_cache
+from exerpy.functions import write_model_cache
 from exerpy.functions import molar_to_mass_fractions
 
 
@@ -533,4 +536,39 @@ def test_convert_to_SI_invalid_unit():
 def test_convert_to_SI_none_value():
     """Test handling of None value in unit conversion."""
     result = convert_to_SI('T', None, 'K')
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+
+def test_model_cache_path_invalidated_by_version_and_schema(tmp_path, monkeypatch):
+    """Test that a changed exerpy version or cache schema misses cached parse results."""
+    model_file = tmp_path / "model.ebs"
+    model_file.write_bytes(b"model")
+    cache_dir = str(tmp_path / "cache")
+
+    cache_path = model_cache_path(str(model_file), True, cache_dir)
+    assert model_cache_path(str(model_file), True, cache_dir) == cache_path
+    assert model_cache_path(str(model_file), False, cache_dir) != cache_path
+
+    monkeypatch.setattr("exerpy.functions._CACHE_SCHEMA", 2)
+    schema_path = model_cache_path(str(model_file), True, cache_dir)
+    assert schema_path != cache_path
+
+    monkeypatch.setattr("exerpy.functions.__version__", "0.0.0+other")
+    assert model_cache_path(str(model_file), True, cache_dir) not in (cache_path, schema_path)
+
+
+def test_read_model_cache(tmp_path):
+    """Test that cached parse results are read back and that a missing entry returns None."""
+    cache_path = str(tmp_path / "cache" / "entry.json")
+    assert read_model_cache(cache_path) is None
+
+    data = {"components": {}, "connections": {"1": {"kind": "material"}}}
+    write_model_cache(cache_path, data)
+    assert read_model_cache(cache_path) == data
+
+
+def test_read_model_cache_corrupt_entry(tmp_path):
+    """Test that an unreadable cache entry is treated as a cache miss."""
+    cache_path = tmp_path / "entry.json"
+    cache_path.write_text('{"components": {')
+    assert read_model_cache(str(cache_path)) is None
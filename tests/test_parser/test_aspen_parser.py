@@ -256,13 +256,11 @@ def test_parse_streams(dummy_convert_to_SI, dummy_fluid_property_data):
 
     # Mole and mass fraction nodes.
     mole_frac_node = DummyNode("MOLEFRAC")
-    mole_frac_node.Elements = DummyCollection([DummyNode("Water")])
+    mole_frac_node.Elements = DummyCollection([DummyNode("Water", 0.9), DummyNode("CO2", 0)])
     nodes[r"\Data\Streams\Stream3\Output\MOLEFRAC\MIXED"] = mole_frac_node
-    nodes[r"\Data\Streams\Stream3\Output\MOLEFRAC\MIXED\Water"] = DummyNode("Water", 0.9)
     mass_frac_node = DummyNode("MASSFRAC")
-    mass_frac_node.Elements = DummyCollection([DummyNode("Water")])
+    mass_frac_node.Elements = DummyCollection([DummyNode("Water", 0.8), DummyNode("CO2", 0)])
     nodes[r"\Data\Streams\Stream3\Output\MASSFRAC\MIXED"] = mass_frac_node
-    nodes[r"\Data\Streams\Stream3\Output\MASSFRAC\MIXED\Water"] = DummyNode("Water", 0.8)
 
     tree = DummyTree(nodes)
     dummy_aspen = DummyAspen(tree)
@@ -296,6 +294,8 @@ def test_parse_streams(dummy_convert_to_SI, dummy_fluid_property_data):
     assert conn3['n'] == 10
     assert conn3['molar_composition'].get("Water") == 0.9
     assert conn3['mass_composition'].get("Water") == 0.8
+    assert "CO2" not in conn3['molar_composition']
+    assert "CO2" not in conn3['mass_composition']
 
 # --- Tests for parse_blocks and component grouping ---
 
@@ -307,7 +307,7 @@ def test_parse_blocks_and_grouping(dummy_convert_to_SI, dummy_fluid_property_dat
     - A Heater block that should create a heat connection.
     - A Mult block with factor < 1 (Generator scenario).
     - A Pump block that creates an associated Motor.
-    - Grouping of components based on type using grouped_components.
+    - Grouping of components based on type using component_groups.
     
     Verifies
     --------
@@ -318,10 +318,11 @@ def test_parse_blocks_and_grouping(dummy_convert_to_SI, dummy_fluid_property_dat
     ap.convert_to_SI = dummy_convert_to_SI
     ap.fluid_property_data = dummy_fluid_property_data
 
-    # Patch grouped_components and connector_mappings.
-    dummy_grouped = {"GroupA": ["Heater", "Pump", "Mult", "Compressor", "Turbine"], "GroupB": ["Other"]}
+    # Patch the component groups and connector_mappings.
+    dummy_groups = {"Heater": "GroupA", "Pump": "GroupA", "Mult": "GroupA", "Compressor": "GroupA",
+                    "Turbine": "GroupA", "Other": "GroupB"}
     dummy_connector_mappings = {}
-    ap.grouped_components = dummy_grouped
+    ap.component_groups = dummy_groups
     ap.connector_mappings = dummy_connector_mappings
 
     blocks_parent = DummyNode("Blocks")
@@ -365,6 +366,10 @@ def test_parse_blocks_and_grouping(dummy_convert_to_SI, dummy_fluid_property_dat
     assert "Block3" in parser.components_data.get("GroupA", {})
     # For Pump block, also expect a motor group created with name "Block3-MOTOR" in the Motor group.
     assert "Block3-MOTOR" in parser.components_data.get("Motor", {})
+    # The motor takes the brake power read for the pump and the electrical power of the pump.
+    motor = parser.components_data["Motor"]["Block3-MOTOR"]
+    assert motor['P_mech'] == parser.components_data["GroupA"]["Block3"]['P'] == 80
+    assert motor['P_el'] == 120
 
     # Check that heater connection is created.
     heater_conn_name = "Block1_HEAT"
@@ -375,6 +380,49 @@ def test_parse_blocks_and_grouping(dummy_convert_to_SI, dummy_fluid_property_dat
     assert elec_conn_name in parser.connections_data
     assert mech_conn_name in parser.connections_data
 
+def test_parse_blocks_motor_multiplier(dummy_convert_to_SI, dummy_fluid_property_data):
+    """
+    Test that a Mult block with factor > 1 is parsed as a Motor.
+
+    Verifies
+    --------
+    - The block is grouped as Motor with eta_el = 1 / factor.
+    - The electrical and mechanical power are taken from the work streams at its ports.
+    """
+    import exerpy.parser.from_aspen.aspen_parser as ap
+    ap.convert_to_SI = dummy_convert_to_SI
+    ap.fluid_property_data = dummy_fluid_property_data
+    ap.component_groups = {}
+    ap.connector_mappings = {}
+
+    block = DummyBlockNode("Mot1", "WORK", "Mult")
+    blocks_parent = DummyNode("Blocks")
+    blocks_parent.Elements = DummyCollection([block])
+    ws_out = DummyNode("WS(OUT)")
+    ws_out.Elements = DummyCollection([DummyNode("ELEC")])
+    ws_in = DummyNode("WS(IN)")
+    ws_in.Elements = DummyCollection([DummyNode("MECH")])
+    tree_nodes = {
+        r"\Data\Blocks": blocks_parent,
+        r"\Data\Blocks\Mot1": block,
+        r"\Data\Blocks\Mot1\Input\FACTOR": DummyNode("FACTOR", 1.25),
+        r"\Data\Blocks\Mot1\Ports\WS(OUT)": ws_out,
+        r"\Data\Blocks\Mot1\Ports\WS(IN)": ws_in,
+    }
+    parser = AspenModelParser("dummy_model.apw")
+    parser.aspen = DummyAspen(DummyTree(tree_nodes))
+    parser.connections_data = {
+        "ELEC": {"energy_flow": -125},
+        "MECH": {"energy_flow": 100},
+    }
+
+    parser.parse_blocks()
+
+    motor = parser.components_data["Motor"]["Mot1"]
+    assert motor['eta_el'] == pytest.approx(0.8)
+    assert motor['P_el'] == 125
+    assert motor['P_mech'] == 100
+
 # --- Tests for connector assignment routines ---
 
 def test_assign_mixer_connectors():
@@ -504,13 +552,23 @@ def test_group_component():
     --------
     - The component is stored under the correct group based on its type.
     """
-    dummy_grouped = {"GroupA": ["TypeA"], "GroupB": ["TypeB"]}
+    dummy_groups = {"TypeA": "GroupA", "TypeB": "GroupB"}
     import exerpy.parser.from_aspen.aspen_parser as ap
-    ap.grouped_components = dummy_grouped
+    ap.component_groups = dummy_groups
     parser = AspenModelParser("dummy.apw")
     component_data = {"name": "Comp1", "type": "TypeA"}
     parser.group_component(component_data, "Comp1")
     assert "Comp1" in parser.components_data.get("GroupA", {})
+    # Components of an unknown type are grouped under their type name
+    parser.group_component({"name": "Comp2", "type": "TypeC"}, "Comp2")
+    assert "Comp2" in parser.components_data.get("TypeC", {})
+
+def test_component_groups_first_match_wins():
+    """
+    Test that Compr blocks, listed under Turbine and Compressor, are grouped as turbines.
+    """
+    from exerpy.parser.from_aspen.aspen_config import component_groups
+    assert component_groups['Compr'] == "Turbine"
 
 # --- Integration Test for parse_model ---
 
@@ -569,3 +627,18 @@ def test_run_aspen_file_not_found(tmp_path):
     with patch('os.path.exists', return_value=False):
         with pytest.raises(FileNotFoundError, match="Model file not found"):
             run_aspen("nonexistent.apw", str(tmp_path / "output.json"))
+
+def test_run_aspen_writes_parsed_data(tmp_path):
+    """
+    Test that run_aspen writes the data it returns without sorting the parsed model again.
+    """
+    model_file = tmp_path / "model.bkp"
+    model_file.write_bytes(b"aspen archive")
+    output_file = tmp_path / "output.json"
+
+    with patch('exerpy.parser.from_aspen.aspen_parser.AspenModelParser') as mock_parser:
+        parser = mock_parser.return_value
+        parsed_data = run_aspen(str(model_file), str(output_file))
+
+        assert parser.get_sorted_data.call_count == 1
+        parser.write_to_json.assert_called_once_with(str(output_file), data=parsed_data)
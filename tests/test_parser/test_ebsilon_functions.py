@@ -18,8 +18,18 @@ from exerpy.parser.from_ebsilon.ebsilon_config import substance_mapping
 from exerpy.parser.from_ebsilon.ebsilon_functions import calc_eM
 from exerpy.parser.from_ebsilon.ebsilon_functions import calc_eT
 from exerpy.parser.from_ebsilon.ebsilon_functions import calc_X_from_PT
+from exerpy.parser.from_ebsilon.ebsilon_functions import clear_property_caches
+from exerpy.parser.from_ebsilon.ebsilon_functions import ebsilon_fluid
 
 
+@pytest.fixture(autouse=True)
+def empty_property_caches():
+    """
+    Clear the memoized FluidData objects and property values before each test,
+    as EbsilonModelParser.parse_model does before parsing a model.
+    """
+    clear_property_caches()
+
 @pytest.fixture
 def mock_app():
     """
@@ -164,6 +174,131 @@ def test_calc_X_from_PT_flue_gas(mock_app, mock_pipe):
     assert result is not None
 
 
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_calc_X_from_PT_flue_gas_reuses_fluid_data(mock_app, mock_pipe):
+    """
+    Test that the FluidData of a gas composition is set up once and reused.
+
+    Verifies
+    --------
+    - Repeated property calls for the same composition create a single FluidData object
+    - The enthalpy is evaluated for each requested state
+    """
+    mock_pipe.Kind = 1001  # Flue gas type
+    mock_pipe.XO2.Value = 0.21
+    mock_pipe.XN2.Value = 0.79
+    mock_app.NewFluidData.return_value.PropertyH_OF_PT.return_value = 1000.0
+
+    calc_X_from_PT(mock_app, mock_pipe, 'H', 1e5, 400)
+    calc_X_from_PT(mock_app, mock_pipe, 'H', 2e5, 500)
+
+    assert mock_app.NewFluidData.call_count == 1
+    assert mock_app.NewFluidData.return_value.PropertyH_OF_PT.call_count == 2
+
+
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_calc_X_from_PT_steam_reuses_fluid_data(mock_app, mock_pipe):
+    """
+    Test that enthalpy and entropy of a steam stream share one FluidData object.
+    """
+    fluid_data = mock_app.NewFluidData.return_value
+    fluid_data.PropertyH_OF_PT.return_value = 2700.0
+    fluid_data.PropertyS_OF_PT.return_value = 7.0
+
+    calc_X_from_PT(mock_app, mock_pipe, 'H', 1e5, 400)
+    calc_X_from_PT(mock_app, mock_pipe, 'S', 1e5, 400)
+
+    assert mock_app.NewFluidData.call_count == 1
+    assert fluid_data.SetAnalysis.call_count == 1
+
+
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_calc_X_from_PT_reuses_property_at_same_state(mock_app, mock_pipe):
+    """
+    Test that a property is computed once per fluid and state of an application.
+
+    Verifies
+    --------
+    - A repeated call at the same state returns the stored value without calling Ebsilon
+    - After clearing the caches, a new application does not reuse the stored value
+    """
+    mock_app.NewFluidData.return_value.PropertyH_OF_PT.return_value = 1000.0
+
+    first = calc_X_from_PT(mock_app, mock_pipe, 'H', 1e5, 400)
+    second = calc_X_from_PT(mock_app, mock_pipe, 'H', 1e5, 400)
+
+    assert first == second == pytest.approx(1e6)
+    assert mock_app.NewFluidData.return_value.PropertyH_OF_PT.call_count == 1
+
+    clear_property_caches()
+    other_app = Mock()
+    other_app.NewFluidData.return_value.PropertyH_OF_PT.return_value = 1000.0
+    calc_X_from_PT(other_app, mock_pipe, 'H', 1e5, 400)
+    assert other_app.NewFluidData.return_value.PropertyH_OF_PT.call_count == 1
+
+
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_calc_X_from_PT_other_app_does_not_reuse_caches(mock_app, mock_pipe):
+    """
+    Test that a second Ebsilon application gets its own FluidData without clearing the caches.
+    """
+    mock_app.NewFluidData.return_value.PropertyH_OF_PT.return_value = 1000.0
+    other_app = Mock()
+    other_app.NewFluidData.return_value.PropertyH_OF_PT.return_value = 1100.0
+
+    assert calc_X_from_PT(mock_app, mock_pipe, 'H', 1e5, 400) == pytest.approx(1e6)
+    assert calc_X_from_PT(other_app, mock_pipe, 'H', 1e5, 400) == pytest.approx(1.1e6)
+
+    assert other_app.NewFluidData.called
+    assert other_app.NewFluidData.return_value.PropertyH_OF_PT.call_count == 1
+
+
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_calc_X_from_PT_with_fluid_does_not_read_composition(mock_app):
+    """
+    Test that a given fluid is used without reading the composition from the pipe.
+    """
+    pipe = Mock(spec=[])  # any attribute access raises an AttributeError
+    fluid = (1, ((1, 0.79), (2, 0.21)))  # flue gas of two substances
+    mock_app.NewFluidData.return_value.PropertyH_OF_PT.return_value = 1000.0
+
+    assert calc_X_from_PT(mock_app, pipe, 'H', 1e5, 400, fluid) == pytest.approx(1e6)
+    assert calc_X_from_PT(mock_app, pipe, 'H', 1e5, 400, fluid) == pytest.approx(1e6)
+    assert mock_app.NewFluidData.return_value.PropertyH_OF_PT.call_count == 1
+
+
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_ebsilon_fluid_from_mass_composition(mock_pipe):
+    """
+    Test that the fluid identified from a parsed mass composition matches the one read from the pipe.
+    """
+    mock_pipe.Kind = 1001  # Flue gas type
+    mock_pipe.XO2.Value = 0.21
+    mock_pipe.XN2.Value = 0.79
+
+    from_pipe = ebsilon_fluid(mock_pipe)
+    assert from_pipe[0] == 1
+    assert ebsilon_fluid(mock_pipe, {"N2": 0.79, "O2": 0.21}) == from_pipe
+
+
 @pytest.mark.skipif(
     __ebsilon_path__ is None,
     reason='Test skipped due to missing ebsilon dependency.'
@@ -260,9 +395,9 @@ def test_calc_X_from_PT_water(monkeypatch, mock_app, mock_pipe):
     Test calc_X_from_PT for water conditions.
     We simulate a condition where the saturation temperature is high so that the water branch is taken.
     """
-    # Override CP so that t_sat is high (e.g., 400 K)
+    # Override the saturation temperature so that t_sat is high (e.g., 400 K)
     monkeypatch.setattr(
-        "exerpy.parser.from_ebsilon.ebsilon_functions.CP",
+        "exerpy.parser.from_ebsilon.ebsilon_functions._saturation_temperature",
         lambda *args, **kwargs: 400
     )
     # Set a return value for PropertyH_OF_PT so that the calculation succeeds.
@@ -275,6 +410,26 @@ def test_calc_X_from_PT_water(monkeypatch, mock_app, mock_pipe):
     assert result == pytest.approx(1e6, rel=1e-2)
 
 
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_calc_X_from_PT_steam_pipe_below_saturation(monkeypatch, mock_app, mock_pipe):
+    """
+    Test that a steam pipe below the saturation temperature is evaluated as water.
+    """
+    monkeypatch.setattr(
+        "exerpy.parser.from_ebsilon.ebsilon_functions._saturation_temperature",
+        lambda *args, **kwargs: 400
+    )
+    mock_pipe.Kind = 1003  # Steam fluid type
+    mock_app.NewFluidData.return_value.PropertyH_OF_PT.return_value = 1000.0
+
+    calc_X_from_PT(mock_app, mock_pipe, 'H', 1e5, 300)
+
+    assert mock_app.NewFluidData.return_value.FluidType == 4
+
+
 @pytest.mark.skipif(
     __ebsilon_path__ is None,
     reason='Test skipped due to missing ebsilon dependency.'
@@ -285,6 +440,7 @@ def test_calc_X_from_PT_invalid_property(monkeypatch, mock_app, mock_pipe):
     """
     result = calc_X_from_PT(mock_app, mock_pipe, 'InvalidProperty', 1e5, 300)
     assert result is None
+    assert not mock_app.NewFluidData.called
 
 # -----------------------------------------------
 # Tests for calc_eT and calc_eM
@@ -311,7 +467,7 @@ def test_calc_eT_known(monkeypatch, mock_app, mock_pipe):
          = 2000 - 1900 - 300*(4 - 3.8)
          = 100 - 300*0.2 = 100 - 60 = 40 J/kg.
     """
-    def dummy_calc_X_from_PT(app, pipe, prop, pressure, temperature):
+    def dummy_calc_X_from_PT(app, pipe, prop, pressure, temperature, fluid=None):
         if prop == 'H':
             return 1900.0
         elif prop == 'S':
@@ -357,7 +513,7 @@ def test_calc_eT_error(monkeypatch, mock_app, mock_pipe):
     Test error handling in calc_eT.
     If calc_X_from_PT raises an exception, calc_eT should propagate the error.
     """
-    def dummy_calc_X_from_PT(app, pipe, prop, pressure, temperature):
+    def dummy_calc_X_from_PT(app, pipe, prop, pressure, temperature, fluid=None):
         raise Exception("Test error in CP")
     monkeypatch.setattr(
         "exerpy.parser.from_ebsilon.ebsilon_functions.calc_X_from_PT",
@@ -267,6 +267,14 @@ def test_parse_component(parser, mock_component):
     assert isinstance(parser.Tamb, (int, float))
 
 
+def test_component_group_by_id_first_match_wins():
+    """
+    Test that component number 68, listed under Turbine and Valve, is grouped as a turbine.
+    """
+    from exerpy.parser.from_ebsilon.ebsilon_config import component_group_by_id
+    assert component_group_by_id[68] == "Turbine"
+
+
 @pytest.mark.skipif(
     __ebsilon_path__ is None,
     reason='Test skipped due to missing ebsilon dependency.'
@@ -425,7 +433,9 @@ def test_run_ebsilon(mock_dispatch, tmp_path):
         mock_parser.initialize_model.assert_called_once()
         mock_parser.simulate_model.assert_called_once()
         mock_parser.parse_model.assert_called_once()
-        mock_parser.write_to_json.assert_called_once()
+        # The returned data is written as is, without sorting the parsed model again
+        mock_parser.get_sorted_data.assert_called_once()
+        mock_parser.write_to_json.assert_called_once_with(str(tmp_path / "output.json"), data=result)
 
 
 @pytest.mark.skipif(
@@ -526,6 +536,18 @@ def test_parse_model_with_ambient(parser_with_ambient):
     assert parser_with_ambient.Tamb == 300.0
     assert parser_with_ambient.pamb == 101325
 
+@pytest.mark.skipif(
+    __ebsilon_path__ is None,
+    reason='Test skipped due to missing ebsilon dependency.'
+)
+def test_parse_model_clears_property_caches(parser_with_ambient):
+    """
+    Test that parse_model starts with empty FluidData and property caches.
+    """
+    with patch('exerpy.parser.from_ebsilon.ebsilon_functions.clear_property_caches') as clear_caches:
+        parser_with_ambient.parse_model()
+    clear_caches.assert_called_once_with()
+
 # ---------- Data Sorting and JSON Export Tests ----------
 
 @pytest.mark.skipif(
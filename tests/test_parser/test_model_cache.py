@@ -0,0 +1,74 @@
+"""
+Test suite for the cached parse results of the Aspen and Ebsilon parsers.
+
+run_aspen and run_ebsilon share the cache helpers of exerpy.functions. The tests
+run both parsers with a mocked model parser and verify that:
+- An unchanged model file is loaded from the cache instead of being parsed again
+- A changed model file, force=True or a bumped cache schema parse the model again
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from exerpy.parser.from_aspen.aspen_parser import run_aspen
+from exerpy.parser.from_ebsilon.ebsilon_parser import run_ebsilon
+
+PARSERS = [
+    pytest.param(
+        run_aspen, 'exerpy.parser.from_aspen.aspen_parser.AspenModelParser', None, "model.bkp", 'parse_model',
+        id="aspen"
+    ),
+    pytest.param(
+        run_ebsilon, 'exerpy.parser.from_ebsilon.ebsilon_parser.EbsilonModelParser',
+        'exerpy.parser.from_ebsilon.ebsilon_parser.is_ebsilon_available', "model.ebs", 'simulate_model',
+        id="ebsilon"
+    ),
+]
+
+
+@pytest.mark.parametrize("run_parser, parser_class, availability_check, model_name, parse_method", PARSERS)
+def test_run_parser_cache(
+    tmp_path, monkeypatch, run_parser, parser_class, availability_check, model_name, parse_method
+):
+    """
+    Test that a parser reuses the cached parse result of an unchanged model file.
+
+    Verifies
+    --------
+    - The first call parses the model and stores the result in the cache directory.
+    - A second call with the same model content returns the cached data without parsing.
+    - A changed model file is parsed again.
+    - force=True parses the model although a cached result exists.
+    - A bumped cache schema parses the model again.
+    """
+    model_file = tmp_path / model_name
+    model_file.write_bytes(b"model")
+    cache_dir = tmp_path / "cache"
+    parsed = {"components": {}, "connections": {"1": {"kind": "material"}}, "ambient_conditions": {}}
+
+    if availability_check is not None:
+        # The simulator is not installed here, so its availability check is bypassed
+        monkeypatch.setattr(availability_check, lambda: True)
+
+    with patch(parser_class) as mock_parser:
+        parse = getattr(mock_parser.return_value, parse_method)
+        mock_parser.return_value.get_sorted_data.return_value = parsed
+
+        assert run_parser(str(model_file), cache_dir=str(cache_dir)) == parsed
+        assert parse.call_count == 1
+        assert len(list(cache_dir.iterdir())) == 1
+
+        assert run_parser(str(model_file), cache_dir=str(cache_dir)) == parsed
+        assert parse.call_count == 1
+
+        model_file.write_bytes(b"modified model")
+        run_parser(str(model_file), cache_dir=str(cache_dir))
+        assert parse.call_count == 2
+
+        run_parser(str(model_file), cache_dir=str(cache_dir), force=True)
+        assert parse.call_count == 3
+
+        monkeypatch.setattr("exerpy.functions._CACHE_SCHEMA", 2)
+        run_parser(str(model_file), cache_dir=str(cache_dir))
+        assert parse.call_count == 4